@@ -0,0 +1,41 @@
+# account/auth_cache.py
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+USER_CACHE_KEY = "auth_user:{}"
+USER_CACHE_TTL = 60  # seconds
+
+
+def invalidate_cached_user(user_id):
+    """Drop the cached user object so the next request re-reads it."""
+    cache.delete(USER_CACHE_KEY.format(user_id))
+
+
+def invalidate_cached_users(user_ids):
+    cache.delete_many([USER_CACHE_KEY.format(pk) for pk in user_ids])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that keeps the resolved user object in the cache
+    for USER_CACHE_TTL seconds, keyed by the token's user id claim.
+    Saves one SELECT on CustomUser per authenticated request. The cache
+    must be shared across workers (settings.CACHES); the entry is dropped
+    whenever the user row is saved or deleted (see signals) and on
+    CustomUser queryset update() / bulk_update().
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            # let simplejwt raise its usual InvalidToken
+            return super().get_user(validated_token)
+
+        key = USER_CACHE_KEY.format(user_id)
+        user = cache.get(key)
+        if user is None:
+            # inactive / missing users raise here and are never cached
+            user = super().get_user(validated_token)
+            cache.set(key, user, USER_CACHE_TTL)
+        return user
@@ -15,7 +15,25 @@ from core import utils
 from market_intelligence.models import Region, Town, District
 
 
-class CustomUserManager(BaseUserManager):
+class CustomUserQuerySet(models.QuerySet):
+    """Bulk writes skip post_save, so they drop the cached auth users themselves."""
+
+    def update(self, **kwargs):
+        from account.auth_cache import invalidate_cached_users  # local import avoids circular
+        user_ids = list(self.values_list("pk", flat=True))
+        rows = super().update(**kwargs)
+        invalidate_cached_users(user_ids)
+        return rows
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        from account.auth_cache import invalidate_cached_users
+        objs = list(objs)
+        rows = super().bulk_update(objs, fields, batch_size=batch_size)
+        invalidate_cached_users([obj.pk for obj in objs])
+        return rows
+
+
+class CustomUserManager(BaseUserManager.from_queryset(CustomUserQuerySet)):
     """UserManager that uses *phone_number* as the canonical login key."""
 
     use_in_migrations = True
@@ -1,5 +1,7 @@
-from django.db.models.signals import post_save, m2m_changed
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver
+
+from .auth_cache import invalidate_cached_user
 from .models import (
     CustomUser, UserProfile, VendorProfile,
     AggregatorProfile, AgentProfile, Role,
@@ -42,5 +44,8 @@ def create_profiles_on_role_add(sender, instance, action, **kwargs):
         _ensure_role_profiles(instance)
 
 
-
-
+# 2. drop the cached auth user on any change (password, is_active, …)
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_auth_user_cache(sender, instance, **kwargs):
+    invalidate_cached_user(instance.pk)
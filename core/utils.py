@@ -26,7 +26,25 @@ def get_config():
 
 
 import calendar
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8192)
+def _date_parts(d: date) -> tuple:
+    # everything except the timestamp depends only on the calendar day
+    month_idx = d.month
+    quarter_idx = (month_idx - 1) // 3 + 1
+    week_of_year = d.isocalendar().week
+
+    # week-of-month = 1-based index of Monday-anchored week in that month
+    first_day_week = date(d.year, d.month, 1).isocalendar().week
+    week_of_month = week_of_year - first_day_week + 1
+
+    return (
+        d.isoformat(), d.year, f"Q{quarter_idx}",
+        calendar.month_name[month_idx], week_of_year, week_of_month,
+    )
 
 
 def date_breakdown(dt: datetime) -> dict:
@@ -45,20 +63,13 @@ def date_breakdown(dt: datetime) -> dict:
         "week_of_month" : 4
     }
     """
-    month_idx = dt.month
-    quarter_idx = (month_idx - 1) // 3 + 1
-    week_of_year = dt.isocalendar().week
-
-    # week-of-month = 1-based index of Monday-anchored week in that month
-    first_day_week = datetime(dt.year, dt.month, 1).isocalendar().week
-    week_of_month = week_of_year - first_day_week + 1
-
+    day, year, quarter, month, week_of_year, week_of_month = _date_parts(dt.date())
     return {
-        "date": dt.date().isoformat(),
+        "date": day,
         "datetime": dt.isoformat(),
-        "year": dt.year,
-        "quarter": f"Q{quarter_idx}",
-        "month": calendar.month_name[month_idx],
+        "year": year,
+        "quarter": quarter,
+        "month": month,
         "week_of_year": week_of_year,
         "week_of_month": week_of_month,
     }
@@ -22,6 +22,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework_simplejwt.token_blacklist',
     'account',
     'cart_management',
@@ -94,7 +95,12 @@ JAZZMIN_SETTINGS = {
 
 # JWT Authentication settings
 SIMPLE_JWT = {
-    "ACCESS_TOKEN_LIFETIME": timedelta(minutes=720),  # short‑lived
+    # Access tokens are not blacklisted, so keep them short-lived to bound how
+    # long a leaked token stays usable; clients renew through the rotating
+    # refresh token. The user row is still loaded per request (cached by
+    # account.auth_cache.CachedJWTAuthentication and dropped on user writes),
+    # so deactivating a user takes effect there, not at token expiry.
+    "ACCESS_TOKEN_LIFETIME": timedelta(minutes=15),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=3),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
@@ -106,7 +112,16 @@ SIMPLE_JWT = {
 }
 
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": ["rest_framework_simplejwt.authentication.JWTAuthentication"],
+    "DEFAULT_AUTHENTICATION_CLASSES": ["account.auth_cache.CachedJWTAuthentication"],
+    "DEFAULT_RENDERER_CLASSES": [
+        "drf_orjson_renderer.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "drf_orjson_renderer.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "EXCEPTION_HANDLER": "account.exceptions.custom_exception_handler",
     "DEFAULT_THROTTLE_CLASSES": [
         "rest_framework.throttling.AnonRateThrottle",
@@ -208,6 +223,31 @@ else:
         }
     }
 
+    # Optional read replica for heavy read-only admin reports (exports,
+    # insights). Same credentials as the primary, only the host differs.
+    POSTGRES_REPLICA_HOST = config("POSTGRES_REPLICA_HOST", default="")
+    if POSTGRES_REPLICA_HOST:
+        DATABASES['replica'] = {
+            **DATABASES['default'],
+            'HOST': POSTGRES_REPLICA_HOST,
+            'TEST': {'MIRROR': 'default'},
+        }
+
+# Shared cache. Every gunicorn worker must see the same entries and the same
+# signal-driven invalidations (auth user, tag table, forum and search payloads);
+# per-process LocMem is only good enough for the single-process sqlite setup.
+if USE_LITE:
+    CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': config("REDIS_CACHE_URL", default="redis://127.0.0.1:6379/1"),
+        },
+    }
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -251,6 +291,13 @@ EMAIL_OTP_EXPIRY_MINUTES = config("EMAIL_OTP_EXPIRY_MINUTES", default=10)
 # Celery settings
 CELERY_BROKER_URL = config("REDIS_URL", default="redis://127.0.0.1:6379/0")
 CELERY_RESULT_BACKEND = CELERY_BROKER_URL
+CELERY_BEAT_SCHEDULE = {
+    # the write path keeps running stats; re-sync them with history hourly
+    "reconcile-listing-stats": {
+        "task": "market_intelligence.tasks.reconcile_listing_stats",
+        "schedule": timedelta(hours=1),
+    },
+}
 
 # Security settings (Production-specific)
 if not DEBUG:
@@ -1,5 +1,7 @@
 import django_filters
-from django.db.models import Q
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F, Q
 from django_filters import rest_framework as filters
 
 from .models import Feedback, FeedbackTag
@@ -13,7 +15,7 @@ class FeedbackFilter(filters.FilterSet):
     reviewed = filters.BooleanFilter(field_name="reviewed")
     feedback_type = filters.CharFilter(field_name="feedback_type", lookup_expr="iexact")
     user = filters.ModelChoiceFilter(queryset=User.objects.all())
-    ip_address = filters.CharFilter(lookup_expr="icontains")
+    ip_address = filters.CharFilter(lookup_expr="exact")
     source_url = filters.CharFilter(lookup_expr="icontains")
 
     # rating range
@@ -56,9 +58,18 @@ class FeedbackFilter(filters.FilterSet):
         ]
 
     def filter_search(self, queryset, name, value):
-        return queryset.filter(
-            Q(title__icontains=value) |
-            Q(message__icontains=value)
+        # the sqlite dev database has no tsvector support
+        if connection.vendor != "postgresql":
+            return queryset.filter(
+                Q(title__icontains=value) |
+                Q(message__icontains=value)
+            )
+        query = SearchQuery(value, config="english", search_type="websearch")
+        return (
+            queryset
+            .filter(search_vector=query)
+            .annotate(rank=SearchRank(F("search_vector"), query))
+            .order_by("-rank", "-submitted_at")
         )
 
 
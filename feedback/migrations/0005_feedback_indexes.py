@@ -0,0 +1,57 @@
+# Generated by Django 5.2 on 2026-10-16 09:12
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+TRGM_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=['title', 'message'], name='fb_trgm_idx', opclasses=['gin_trgm_ops', 'gin_trgm_ops'],
+)
+
+
+def add_trgm_index(apps, schema_editor):
+    # GIN / pg_trgm only exist on postgres; the sqlite dev database skips it
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('feedback', 'Feedback'), TRGM_INDEX)
+
+
+def remove_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.remove_index(apps.get_model('feedback', 'Feedback'), TRGM_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feedback', '0004_alter_feedback_content_type'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='feedback',
+            index=models.Index(fields=['-submitted_at'], name='feedback_fe_submitt_69697f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feedback',
+            index=models.Index(fields=['feedback_type', 'reviewed'], name='feedback_fe_feedbac_2674d6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feedback',
+            index=models.Index(fields=['user', '-submitted_at'], name='feedback_fe_user_id_580a8b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feedback',
+            index=models.Index(fields=['rating'], name='feedback_fe_rating_c20163_idx'),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='feedback', index=TRGM_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(add_trgm_index, remove_trgm_index),
+            ],
+        ),
+    ]
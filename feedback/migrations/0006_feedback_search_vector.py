@@ -0,0 +1,71 @@
+# Generated by Django 5.2 on 2026-10-16 10:05
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+SEARCH_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=['search_vector'], name='fb_search_vector_idx',
+)
+# 0005's title/message trigram index – search reads search_vector from here on
+TRGM_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=['title', 'message'], name='fb_trgm_idx', opclasses=['gin_trgm_ops', 'gin_trgm_ops'],
+)
+
+CREATE_TRIGGER = """
+CREATE TRIGGER feedback_search_vector_update
+BEFORE INSERT OR UPDATE OF title, message ON feedback_feedback
+FOR EACH ROW EXECUTE FUNCTION
+tsvector_update_trigger(search_vector, 'pg_catalog.english', title, message);
+"""
+
+BACKFILL = """
+UPDATE feedback_feedback
+SET search_vector = to_tsvector('pg_catalog.english', coalesce(title, '') || ' ' || coalesce(message, ''));
+"""
+
+DROP_TRIGGER = "DROP TRIGGER IF EXISTS feedback_search_vector_update ON feedback_feedback;"
+
+
+def add_search_support(apps, schema_editor):
+    # tsvector triggers and GIN indexes only exist on postgres
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Feedback = apps.get_model('feedback', 'Feedback')
+    schema_editor.remove_index(Feedback, TRGM_INDEX)
+    schema_editor.add_index(Feedback, SEARCH_INDEX)
+    schema_editor.execute(CREATE_TRIGGER)
+    schema_editor.execute(BACKFILL)
+
+
+def remove_search_support(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Feedback = apps.get_model('feedback', 'Feedback')
+    schema_editor.execute(DROP_TRIGGER)
+    schema_editor.remove_index(Feedback, SEARCH_INDEX)
+    schema_editor.add_index(Feedback, TRGM_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feedback', '0005_feedback_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='feedback',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveIndex(model_name='feedback', name='fb_trgm_idx'),
+                migrations.AddIndex(model_name='feedback', index=SEARCH_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(add_search_support, remove_search_support),
+            ],
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-16 17:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feedback', '0006_feedback_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='feedback',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -38,10 +40,22 @@ class Feedback(models.Model):
     feedback_date = models.DateTimeField(default=timezone.now)
     source_url = models.URLField(blank=True, null=True)
     reviewed_at = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)  # bumped by every save – insights ETag
     tags = models.ManyToManyField(FeedbackTag, blank=True)
     upvotes = models.ManyToManyField(User, related_name="feedback_upvotes", blank=True)
     user_agent = models.TextField(blank=True, null=True)
     ip_address = models.GenericIPAddressField(blank=True, null=True)
+    # maintained by a database trigger from title + message (see migration 0006)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-submitted_at"]),
+            models.Index(fields=["feedback_type", "reviewed"]),
+            models.Index(fields=["user", "-submitted_at"]),
+            models.Index(fields=["rating"]),
+            GinIndex(fields=["search_vector"], name="fb_search_vector_idx"),
+        ]
 
     def __str__(self):
         return f"{self.feedback_type} - {self.title}"
@@ -49,7 +63,7 @@ class Feedback(models.Model):
     def mark_reviewed(self):
         self.reviewed = True
         self.reviewed_at = timezone.now()
-        self.save(update_fields=["reviewed", "reviewed_at"])
+        self.save(update_fields=["reviewed", "reviewed_at", "updated_at"])
 
 
 class FeedbackResponse(models.Model):
@@ -1,3 +1,4 @@
+import logging
 from uuid import UUID
 
 from django.contrib.contenttypes.models import ContentType
@@ -5,6 +6,9 @@ from rest_framework import serializers
 
 from account.serializers import UserMinimalSerializer
 from .models import Feedback, FeedbackTag
+from .utils import get_cached_tags
+
+logger = logging.getLogger(__name__)
 
 
 class FeedbackTagSerializer(serializers.ModelSerializer):
@@ -13,6 +17,29 @@ class FeedbackTagSerializer(serializers.ModelSerializer):
         fields = ['id', 'name']
 
 
+class CachedTagField(serializers.PrimaryKeyRelatedField):
+    """
+    Tag PK field validated against the cached tag table, not one query per id.
+    A miss falls through to the database: the cache may predate a tag created
+    on another worker.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        for tag in get_cached_tags():
+            if tag.pk == pk:
+                return tag
+        tag = self.get_queryset().filter(pk=pk).first()
+        if tag is None:
+            self.fail('does_not_exist', pk_value=data)
+        return tag
+
+
 class FeedbackSerializer(serializers.ModelSerializer):
     model = serializers.ChoiceField(
         choices=[
@@ -24,10 +51,10 @@ class FeedbackSerializer(serializers.ModelSerializer):
     )
     object_id = serializers.UUIDField(write_only=True, required=False)
 
-    tags = serializers.PrimaryKeyRelatedField(
+    tags = CachedTagField(
         many=True, queryset=FeedbackTag.objects.all(), required=False
     )
-    user = serializers.StringRelatedField(read_only=True)
+    user = serializers.CharField(source='user.phone_number', read_only=True, allow_null=True)
     submitted_at = serializers.DateTimeField(read_only=True)
     source_url = serializers.URLField(read_only=True)
 
@@ -45,7 +72,7 @@ class FeedbackSerializer(serializers.ModelSerializer):
 
         # if both provided, attach via ContentType
         if model and object_id:
-            print(model, object_id)
+            logger.debug("feedback attach: %s %s", model, object_id)
             try:
                 ct = ContentType.objects.get(
                     app_label='product_service_management', model=model
@@ -67,7 +94,8 @@ class FeedbackSerializer(serializers.ModelSerializer):
 
 # 1) a lean read‐only serializer for any feedback item
 class FeedbackPublicSerializer(serializers.ModelSerializer):
-    user = serializers.SerializerMethodField()
+    # expects the queryset to be annotated with utils.USER_DISPLAY
+    user = serializers.CharField(source='user_display', read_only=True)
     tags = FeedbackTagSerializer(many=True, read_only=True)
     upvotes_count = serializers.SerializerMethodField()
     attachment_url = serializers.SerializerMethodField()
@@ -87,17 +115,22 @@ class FeedbackPublicSerializer(serializers.ModelSerializer):
             'upvotes_count',
         )
 
-    def get_user(self, obj):
-        return obj.user.get_full_name() if obj.user else "Anonymous"
-
     def get_upvotes_count(self, obj):
-        return obj.upvotes.count()
+        # use the queryset annotation when the caller provided one
+        count = getattr(obj, '_upvotes_count', None)
+        return obj.upvotes.count() if count is None else count
+
+    def _base_uri(self):
+        # scheme://host is the same for every row – resolve it once per serializer
+        if not hasattr(self, '_base_uri_cache'):
+            req = self.context.get("request")
+            self._base_uri_cache = f"{req.scheme}://{req.get_host()}" if req else ""
+        return self._base_uri_cache
 
     def get_attachment_url(self, obj):
-        req = self.context.get("request")
         if obj.attachment:
             url = obj.attachment.url
-            return req.build_absolute_uri(url) if req else url
+            return self._base_uri() + url if url.startswith("/") else url
         return None
 
 
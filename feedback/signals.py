@@ -0,0 +1,12 @@
+# feedback/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import FeedbackTag
+from .utils import invalidate_cached_tags
+
+
+@receiver(post_save, sender=FeedbackTag)
+@receiver(post_delete, sender=FeedbackTag)
+def drop_tag_cache(sender, instance, **_):
+    invalidate_cached_tags()
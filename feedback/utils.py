@@ -0,0 +1,33 @@
+# feedback/utils.py
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, CharField, Value, When
+from django.db.models.functions import Concat, Trim
+
+TAGS_CACHE_KEY = "feedback:tags:v1"
+TAGS_CACHE_TTL = 60 * 60  # 1 hour – invalidated on FeedbackTag change; misses re-check the db
+
+# author's "First Last" (or "Anonymous") built in SQL – annotate as `user_display`
+USER_DISPLAY = Case(
+    When(user__isnull=True, then=Value("Anonymous")),
+    default=Trim(Concat("user__first_name", Value(" "), "user__last_name")),
+    output_field=CharField(),
+)
+
+
+def get_cached_tags():
+    """
+    Return every FeedbackTag as a list, served from the cache.
+    The entry is dropped by the FeedbackTag save/delete signals.
+    """
+    from .models import FeedbackTag  # local import keeps models ↔ utils acyclic
+    return cache.get_or_set(TAGS_CACHE_KEY, lambda: list(FeedbackTag.objects.all()), TAGS_CACHE_TTL)
+
+
+def invalidate_cached_tags():
+    cache.delete(TAGS_CACHE_KEY)
+
+
+def reporting_db():
+    """DB alias for heavy read-only admin reports – the replica when configured."""
+    return "replica" if "replica" in settings.DATABASES else "default"
@@ -1,9 +1,13 @@
 import csv
+import hashlib
 from uuid import UUID
 
+import orjson
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db import models
-from django.http import HttpResponse
+from django.http import HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.http import parse_etags, quote_etag
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
 from rest_framework import viewsets, permissions, status
@@ -15,6 +19,7 @@ from core.response import ok, fail
 from .filters import FeedbackFilter
 from .models import Feedback, FeedbackTag
 from .serializers import FeedbackSerializer, FeedbackTagSerializer
+from .utils import reporting_db
 
 
 @extend_schema(tags=["Feedbacks"])
@@ -45,13 +50,28 @@ class FeedbackViewSet(viewsets.ModelViewSet):
         # tag txt etc. left untouched
         return [permissions.AllowAny()]
 
+    def get_queryset(self):
+        # pull the user / content type in the same query and the tags in one
+        # extra query, instead of one query per row in lists and exports
+        qs = (
+            Feedback.objects
+            .select_related('user', 'content_type')
+            .prefetch_related('tags')
+            .order_by('-submitted_at')
+        )
+        if self.action in ('list', 'mine'):
+            # wide columns the list serializer never renders
+            qs = qs.defer('user_agent', 'ip_address', 'search_vector')
+        return qs
+
     def list(self, request, *args, **kwargs):
         """Admin: list all feedback."""
-        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
-        ser = self.get_serializer(page or self.get_queryset(), many=True)
+        qs = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(qs)
+        ser = self.get_serializer(page if page is not None else qs, many=True)
         return (
             self.get_paginated_response(ser.data)
-            if page else ok("OK", ser.data)
+            if page is not None else ok("OK", ser.data)
         )
 
     def retrieve(self, request, *args, **kwargs):
@@ -64,10 +84,10 @@ class FeedbackViewSet(viewsets.ModelViewSet):
         """GET /feedback/mine/ – your own feedback."""
         qs = self.filter_queryset(self.get_queryset().filter(user=request.user))
         page = self.paginate_queryset(qs)
-        ser = self.get_serializer(page or qs, many=True)
+        ser = self.get_serializer(page if page is not None else qs, many=True)
         return (
             self.get_paginated_response(ser.data)
-            if page else ok("OK", ser.data)
+            if page is not None else ok("OK", ser.data)
         )
 
     def create(self, request, *args, **kwargs):
@@ -90,15 +110,19 @@ class FeedbackViewSet(viewsets.ModelViewSet):
     def upvote(self, request, pk=None):
         """POST /feedback/{pk}/upvote/ – upvote a feedback."""
         fb = self.get_object()
-        if request.user in fb.upvotes.all():
+        # the auto-created through table is unique on (feedback, user), and
+        # get_or_create retries the lookup if a concurrent insert wins the race
+        _, created = Feedback.upvotes.through.objects.get_or_create(
+            feedback_id=fb.pk, customuser_id=request.user.pk,
+        )
+        if not created:
             return fail("Already upvoted", status=status.HTTP_400_BAD_REQUEST)
-        fb.upvotes.add(request.user)
         return ok("Upvoted")
 
     @action(detail=False, methods=['get'], url_path='export_csv')
     def export_csv(self, request):
         """Admin: CSV export."""
-        qs = self.filter_queryset(self.get_queryset())
+        qs = self.filter_queryset(self.get_queryset()).using(reporting_db())
         resp = HttpResponse(content_type='text/csv')
         resp['Content-Disposition'] = 'attachment; filename="feedback.csv"'
         w = csv.writer(resp)
@@ -122,15 +146,54 @@ class FeedbackViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'], url_path='export_json')
     def export_json(self, request):
-        """Admin: JSON export."""
-        qs = self.filter_queryset(self.get_queryset()).values()
-        return ok("OK", list(qs))
+        """Admin: JSON export, streamed row by row in the usual ok() envelope."""
+        fields = [
+            f.attname for f in Feedback._meta.concrete_fields
+            if f.name != 'search_vector'
+        ]
+        qs = self.filter_queryset(self.get_queryset()).using(reporting_db()).values(*fields)
+
+        def rows():
+            yield b'{"code":1,"message":"OK","data":['
+            for i, row in enumerate(qs.iterator(chunk_size=1000)):
+                if i:
+                    yield b','
+                yield orjson.dumps(row, option=orjson.OPT_UTC_Z)
+            yield b']}'
+
+        return StreamingHttpResponse(rows(), content_type='application/json')
 
     @action(detail=False, methods=['get'], url_path='insights')
     def insights(self, request):
         """Admin: feedback stats & rating distribution."""
-        qs = self.filter_queryset(self.get_queryset())
-        total = qs.count()
+        qs = self.filter_queryset(self.get_queryset()).using(reporting_db())
+
+        # cheap fingerprint of the filtered rows → conditional GET
+        # (updated_at moves on any edit; the count catches deletes)
+        stamp = qs.aggregate(
+            total=models.Count('id'),
+            last_updated=models.Max('updated_at'),
+        )
+        etag = quote_etag(hashlib.md5(
+            f"{request.get_full_path()}|{stamp['total']}|{stamp['last_updated']}".encode()
+        ).hexdigest())
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            resp = HttpResponseNotModified()
+            resp['ETag'] = etag
+            return resp
+
+        cache_key = f"feedback:insights:{etag}"
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._insights_data(qs, stamp['total'])
+            cache.set(cache_key, data, 60)
+
+        resp = ok("Insights", data)
+        resp['ETag'] = etag
+        return resp
+
+    def _insights_data(self, qs, total):
+        qs = qs.order_by()  # default ordering would leak into the GROUP BY
         by_type = list(qs.values('feedback_type').annotate(count=models.Count('id')))
         reviewed = qs.filter(reviewed=True).count()
         ratings = qs.filter(feedback_type='rating', rating__isnull=False)
@@ -143,14 +206,14 @@ class FeedbackViewSet(viewsets.ModelViewSet):
         for i in range(1, 6):
             dist.setdefault(str(i), 0)
 
-        return ok("Insights", {
+        return {
             'total': total,
             'by_type': by_type,
             'reviewed': reviewed,
             'unreviewed': total - reviewed,
             'average_rating': avg,
             'distribution': dist,
-        })
+        }
 
 
 @extend_schema(tags=["Feedbacks"])
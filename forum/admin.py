@@ -1,8 +1,11 @@
 # forum/admin.py   (or business.admin if you keep it inside the same app)
 from django.contrib import admin
+from django.db.models import BooleanField, Case, Count, Value, When
+from django.db.models.functions import Now
 from django.utils.html import format_html
 from django.utils.text import Truncator
 
+from .utils import invalidate_thread_detail
 from .models import (
     Category,
     Thread,
@@ -40,6 +43,9 @@ class ThreadReplyInline(admin.TabularInline):
     fields = ("author", "short_content", "is_solution", "is_visible", "created_at")
     readonly_fields = fields
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("author")
+
     def short_content(self, obj):
         return short(obj.content, 50)
     short_content.short_description = "Content"
@@ -59,6 +65,8 @@ class ThreadAdmin(admin.ModelAdmin):
         "created_at",
     )
     list_filter = ("category", "is_pinned", "is_locked", "author")
+    list_select_related = ("category", "author")
+    raw_id_fields = ("category", "author")
     search_fields = ("title", "content", "author__email", "author__username")
     prepopulated_fields = {"slug": ("title",)}
     list_editable = ("is_pinned", "is_locked")
@@ -70,9 +78,14 @@ class ThreadAdmin(admin.ModelAdmin):
         ("Dates", {"fields": ("created_at", "updated_at")}),
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_reply_count=Count("replies"))
+
     def reply_count(self, obj):
-        return obj.replies.count()
+        # unsaved (add form) instances carry no annotation
+        return getattr(obj, "_reply_count", 0)
     reply_count.short_description = "Replies"
+    reply_count.admin_order_field = "_reply_count"
 
 
 # ────────────────────────────────────────────────────────────
@@ -86,24 +99,39 @@ class ThreadReplyAdmin(admin.ModelAdmin):
         "created_at",
     )
     list_filter = ("is_solution", "is_visible", "thread", "author")
+    list_select_related = ("thread", "author")
+    raw_id_fields = ("thread", "author")
     search_fields = ("content", "thread__title", "author__email")
     actions = ["mark_solution", "toggle_visibility"]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("thread", "author")
+
     def short_content(self, obj):
         return short(obj.content, 80)
     short_content.short_description = "Content"
 
     def mark_solution(self, request, queryset):
-        updated = queryset.update(is_solution=True)
+        # read the threads first – the changelist filters can exclude the rows once updated
+        thread_ids = set(queryset.values_list("thread_id", flat=True))
+        updated = queryset.update(is_solution=True, updated_at=Now())
+        for thread_id in thread_ids:
+            invalidate_thread_detail(thread_id)
         self.message_user(request, f"{updated} reply(ies) marked as solution.")
     mark_solution.short_description = "Mark selected as solution"
 
     def toggle_visibility(self, request, queryset):
-        updated = 0
-        for reply in queryset:
-            reply.is_visible = not reply.is_visible
-            reply.save(update_fields=["is_visible"])
-            updated += 1
+        thread_ids = set(queryset.values_list("thread_id", flat=True))
+        updated = queryset.update(
+            is_visible=Case(
+                When(is_visible=True, then=Value(False)),
+                default=Value(True),
+                output_field=BooleanField(),
+            ),
+            updated_at=Now(),
+        )
+        for thread_id in thread_ids:
+            invalidate_thread_detail(thread_id)
         self.message_user(request, f"Toggled visibility for {updated} reply(ies).")
     toggle_visibility.short_description = "Toggle visibility"
 
@@ -115,6 +143,8 @@ class ThreadReplyAdmin(admin.ModelAdmin):
 class ThreadReplyVoteAdmin(admin.ModelAdmin):
     list_display = ("user", "reply", "vote_type", "created_at")
     list_filter = ("vote_type",)
+    list_select_related = ("user", "reply__author", "reply__thread")
+    raw_id_fields = ("user", "reply")
     search_fields = ("user__email", "reply__content")
 
 
@@ -124,6 +154,8 @@ class ThreadReplyVoteAdmin(admin.ModelAdmin):
 @admin.register(ThreadSubscription)
 class ThreadSubscriptionAdmin(admin.ModelAdmin):
     list_display = ("user", "thread", "created_at")
+    list_select_related = ("user", "thread")
+    raw_id_fields = ("user", "thread")
     search_fields = ("user__email", "thread__title")
 
 
@@ -139,3 +171,10 @@ class ForumNotificationAdmin(admin.ModelAdmin):
     )
     list_filter = ("is_read", "notification_type")
     search_fields = ("recipient__email", "thread__title", "reply__content")
+    raw_id_fields = ("recipient", "thread", "reply")
+
+    def get_queryset(self, request):
+        # reply.__str__ reads its author and thread too
+        return super().get_queryset(request).select_related(
+            "recipient", "thread", "reply__author", "reply__thread",
+        )
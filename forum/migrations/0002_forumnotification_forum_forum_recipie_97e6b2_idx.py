@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-16 11:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='forumnotification',
+            index=models.Index(fields=['recipient', 'is_read', '-created_at'], name='forum_forum_recipie_97e6b2_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-16 11:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0002_forumnotification_forum_forum_recipie_97e6b2_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='thread',
+            index=models.Index(fields=['category', '-is_pinned', '-created_at'], name='forum_threa_categor_233819_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='threadreply',
+            index=models.Index(fields=['thread', 'created_at'], name='forum_threa_thread__f18fc1_idx'),
+        ),
+    ]
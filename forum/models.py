@@ -45,14 +45,13 @@ class Thread(models.Model):
 
     class Meta:
         ordering = ['-is_pinned', '-created_at']
+        indexes = [
+            models.Index(fields=['category', '-is_pinned', '-created_at']),
+        ]
 
     def __str__(self):
         return self.title
 
-    @property
-    def reply_count(self):
-        return self.replies.count()
-
 
 class ThreadReply(models.Model):
     thread = models.ForeignKey(Thread, on_delete=models.CASCADE, related_name='replies')
@@ -66,6 +65,9 @@ class ThreadReply(models.Model):
     class Meta:
         verbose_name_plural = 'Replies'
         ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['thread', 'created_at']),
+        ]
 
     def __str__(self):
         return f'Reply by {self.author.username} on {self.thread.title}'
@@ -117,6 +119,11 @@ class ForumNotification(models.Model):
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["recipient", "is_read", "-created_at"]),
+        ]
+
     def __str__(self):
         return f"{self.notification_type} notification for {self.recipient.username}"
 
@@ -14,7 +14,8 @@ class IsAuthorOrReadOnly(permissions.BasePermission):
             return True
 
         # Write permissions are only allowed to the author or staff
-        return obj.author == request.user or request.user.is_staff
+        # compare ids: no FK fetch of the author row
+        return obj.author_id == request.user.pk or request.user.is_staff
 
 
 class IsThreadNotLocked(permissions.BasePermission):
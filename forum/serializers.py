@@ -1,10 +1,33 @@
-from django.utils.text import slugify
+import logging
+
+from django.db import IntegrityError, transaction
+from kombu.exceptions import OperationalError
 from rest_framework import serializers
 
 from account.serializers import UserMinimalSerializer
 from .models import Category, Thread, ThreadReply, ThreadReplyVote, ThreadSubscription, ForumNotification
+from .tasks import fanout_reply_notifications
 from django.contrib.auth import get_user_model
 
+logger = logging.getLogger(__name__)
+
+
+def _queue_reply_fanout(reply_id):
+    """
+    Hand the subscriber fan-out to Celery. The reply is already committed here,
+    so a broker outage must not fail the request (the client would re-post):
+    fan out inline instead.
+    """
+    try:
+        fanout_reply_notifications.delay(reply_id)
+    except OperationalError:
+        logger.warning("broker unavailable; fanning out notifications for reply %s inline", reply_id)
+        try:
+            fanout_reply_notifications(reply_id)
+        except Exception:
+            # the reply stands; only its notifications are lost
+            logger.exception("could not fan out notifications for reply %s", reply_id)
+
 
 class CategorySerializer(serializers.ModelSerializer):
     thread_count = serializers.SerializerMethodField()
@@ -14,14 +37,17 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'slug', 'thread_count', 'created_at']
 
     def get_thread_count(self, obj):
-        return obj.threads.count()
+        # CategoryViewSet annotates the count; nested/created instances fall back
+        count = getattr(obj, 'thread_count_ann', None)
+        return obj.threads.count() if count is None else count
 
 
 class ThreadListSerializer(serializers.ModelSerializer):
     author = UserMinimalSerializer(read_only=True)
     category_name = serializers.ReadOnlyField(source='category.name')
-    reply_count = serializers.ReadOnlyField()
-    last_activity = serializers.SerializerMethodField()
+    # both come from ThreadViewSet.get_queryset annotations
+    reply_count = serializers.IntegerField(source='reply_count_ann', read_only=True)
+    last_activity = serializers.DateTimeField(read_only=True)
 
     class Meta:
         model = Thread
@@ -29,27 +55,20 @@ class ThreadListSerializer(serializers.ModelSerializer):
                   'is_pinned', 'is_locked', 'views', 'reply_count',
                   'created_at', 'updated_at', 'last_activity']
 
-    def get_last_activity(self, obj):
-        latest_reply = obj.replies.order_by('-created_at').first()
-        if latest_reply:
-            return latest_reply.created_at
-        return obj.created_at
-
 
 class ThreadCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Thread
         fields = ['title', 'content', 'category']
 
-    def validate_title(self, value):
-        slug = slugify(value)
-        if Thread.objects.filter(slug=slug).exists():
-            raise serializers.ValidationError("Thread with this title already exists.")
-        return value
-
     def create(self, validated_data):
         user = self.context['request'].user
-        thread = Thread.objects.create(author=user, **validated_data)
+        # the unique slug index is the duplicate-title check: one INSERT, no race
+        try:
+            with transaction.atomic():
+                thread = Thread.objects.create(author=user, **validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError({'title': ["Thread with this title already exists."]})
         ThreadSubscription.objects.create(user=user, thread=thread)
         return thread
 
@@ -63,8 +82,9 @@ class VoteSerializer(serializers.ModelSerializer):
 
 class ThreadReplySerializer(serializers.ModelSerializer):
     author = UserMinimalSerializer(read_only=True)
-    votes_count = serializers.SerializerMethodField()
-    current_user_vote = serializers.SerializerMethodField()
+    votes_count = serializers.IntegerField(read_only=True)  # annotated, see views.reply_queryset
+    # annotated for authenticated users only, otherwise null
+    current_user_vote = serializers.IntegerField(read_only=True, allow_null=True)
 
     class Meta:
         model = ThreadReply
@@ -72,19 +92,6 @@ class ThreadReplySerializer(serializers.ModelSerializer):
                   'votes_count', 'current_user_vote', 'created_at', 'updated_at']
         read_only_fields = ['is_solution']
 
-    def get_votes_count(self, obj):
-        return sum(vote.vote_type for vote in obj.votes.all())
-
-    def get_current_user_vote(self, obj):
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            try:
-                vote = obj.votes.get(user=request.user)
-                return vote.vote_type
-            except ThreadReplyVote.DoesNotExist:
-                pass
-        return None
-
 
 class ThreadReplyCreateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -95,17 +102,8 @@ class ThreadReplyCreateSerializer(serializers.ModelSerializer):
         user = self.context['request'].user
         reply = ThreadReply.objects.create(author=user, **validated_data)
 
-        # Create notifications for thread subscribers
-        thread = validated_data['thread']
-        subscribers = ThreadSubscription.objects.filter(thread=thread).exclude(user=user)
-
-        for subscription in subscribers:
-            ForumNotification.objects.create(
-                recipient=subscription.user,
-                thread=thread,
-                reply=reply,
-                notification_type='reply'
-            )
+        # Notify thread subscribers off the request, once the reply is committed
+        transaction.on_commit(lambda: _queue_reply_fanout(reply.id))
 
         return reply
 
@@ -114,7 +112,7 @@ class ThreadDetailSerializer(serializers.ModelSerializer):
     author = UserMinimalSerializer(read_only=True)
     category = CategorySerializer(read_only=True)
     replies = ThreadReplySerializer(many=True, read_only=True)
-    is_subscribed = serializers.SerializerMethodField()
+    is_subscribed = serializers.BooleanField(read_only=True)  # Exists() annotation
 
     class Meta:
         model = Thread
@@ -122,12 +120,6 @@ class ThreadDetailSerializer(serializers.ModelSerializer):
                   'is_pinned', 'is_locked', 'views', 'created_at',
                   'updated_at', 'replies', 'is_subscribed']
 
-    def get_is_subscribed(self, obj):
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return ThreadSubscription.objects.filter(user=request.user, thread=obj).exists()
-        return False
-
 
 class ThreadSubscriptionSerializer(serializers.ModelSerializer):
     class Meta:
@@ -0,0 +1,28 @@
+# forum/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Category, Thread, ThreadReply
+from .utils import invalidate_category_list, invalidate_thread_detail
+
+
+# category names / thread counts changed → drop the cached category list
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Thread)
+@receiver(post_delete, sender=Thread)
+def drop_category_list_cache(sender, instance, **_):
+    invalidate_category_list()
+
+
+# thread edited / reply added, edited or removed → drop the cached detail payload
+@receiver(post_save, sender=Thread)
+@receiver(post_delete, sender=Thread)
+def drop_thread_detail_cache(sender, instance, **_):
+    invalidate_thread_detail(instance.pk)
+
+
+@receiver(post_save, sender=ThreadReply)
+@receiver(post_delete, sender=ThreadReply)
+def drop_reply_thread_detail_cache(sender, instance, **_):
+    invalidate_thread_detail(instance.thread_id)
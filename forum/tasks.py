@@ -0,0 +1,29 @@
+from celery import shared_task
+
+from .models import ThreadReply, ThreadSubscription, ForumNotification
+
+
+@shared_task
+def fanout_reply_notifications(reply_id):
+    """Notify every subscriber of the reply's thread, except its author."""
+    try:
+        reply = ThreadReply.objects.only("id", "thread_id", "author_id").get(pk=reply_id)
+    except ThreadReply.DoesNotExist:
+        return
+
+    recipient_ids = (
+        ThreadSubscription.objects
+        .filter(thread_id=reply.thread_id)
+        .exclude(user_id=reply.author_id)
+        .values_list("user_id", flat=True)
+    )
+
+    ForumNotification.objects.bulk_create([
+        ForumNotification(
+            recipient_id=uid,
+            thread_id=reply.thread_id,
+            reply_id=reply.pk,
+            notification_type="reply",
+        )
+        for uid in recipient_ids
+    ], batch_size=500)
@@ -0,0 +1,44 @@
+# forum/utils.py
+from django.core.cache import cache
+
+# version, hash of the absolute request URI – see CategoryViewSet.list
+CATEGORY_LIST_CACHE_KEY = "forum:categories:{}:{}:v2"
+CATEGORY_LIST_CACHE_TTL = 60 * 5  # invalidated on Category / Thread writes anyway
+CATEGORY_LIST_VERSION_KEY = "forum:categories:version"
+
+
+def category_list_version():
+    return cache.get_or_set(CATEGORY_LIST_VERSION_KEY, 0, None)
+
+
+def invalidate_category_list():
+    """
+    Retire every cached category-list page (one per query string) by bumping
+    the version their keys carry.
+    """
+    try:
+        cache.incr(CATEGORY_LIST_VERSION_KEY)
+    except ValueError:  # evicted / never read yet
+        cache.set(CATEGORY_LIST_VERSION_KEY, 1, None)
+
+
+# thread id, version, row stamp – see ThreadViewSet.retrieve
+THREAD_DETAIL_CACHE_KEY = "forum:thread:{}:{}:{}:v2"
+THREAD_DETAIL_CACHE_TTL = 60 * 5  # also bounds staleness of nested author data
+THREAD_DETAIL_VERSION_KEY = "forum:thread:{}:version"
+
+
+def thread_detail_version(thread_id):
+    return cache.get_or_set(THREAD_DETAIL_VERSION_KEY.format(thread_id), 0, None)
+
+
+def invalidate_thread_detail(thread_id):
+    """
+    Retire the cached shared thread-detail payload after any write that shows
+    in it, by bumping the version its key carries (atomic on the shared cache).
+    """
+    key = THREAD_DETAIL_VERSION_KEY.format(thread_id)
+    try:
+        cache.incr(key)
+    except ValueError:  # evicted / never read yet
+        cache.set(key, 1, None)
@@ -1,7 +1,15 @@
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import (
+    Count, Exists, F, Max, OuterRef, Prefetch, Subquery, Sum, Value, prefetch_related_objects,
+)
+from django.db.models.functions import Coalesce
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
 from rest_framework import viewsets, permissions, status, filters
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 
 from .models import Category, Thread, ThreadReply, ThreadReplyVote, ThreadSubscription, ForumNotification
@@ -11,11 +19,35 @@ from .serializers import (
     ThreadCreateSerializer, ThreadReplySerializer, ThreadReplyCreateSerializer,
     VoteSerializer, ForumNotificationSerializer
 )
+from .utils import (
+    CATEGORY_LIST_CACHE_KEY, CATEGORY_LIST_CACHE_TTL, category_list_version,
+    THREAD_DETAIL_CACHE_KEY, THREAD_DETAIL_CACHE_TTL, invalidate_thread_detail, thread_detail_version,
+)
+
+
+def reply_queryset(user=None):
+    """
+    Replies as ThreadReplySerializer reads them: author joined, vote total
+    summed in SQL and, for an authenticated user, their own vote attached
+    as `current_user_vote` via a correlated subquery.
+    """
+    qs = (
+        ThreadReply.objects
+        .select_related('author')
+        .annotate(votes_count=Coalesce(Sum('votes__vote_type'), 0))
+    )
+    if user is not None and user.is_authenticated:
+        qs = qs.annotate(current_user_vote=Subquery(
+            ThreadReplyVote.objects
+            .filter(reply=OuterRef('pk'), user=user)
+            .values('vote_type')[:1]
+        ))
+    return qs
 
 
 @extend_schema(tags=["Forum Categories"])
 class CategoryViewSet(viewsets.ModelViewSet):
-    queryset = Category.objects.all()
+    queryset = Category.objects.annotate(thread_count_ann=Count('threads'))
     serializer_class = CategorySerializer
     permission_classes = [permissions.IsAdminUser]
     lookup_field = 'slug'
@@ -25,6 +57,22 @@ class CategoryViewSet(viewsets.ModelViewSet):
             return [permissions.AllowAny()]
         return super().get_permissions()
 
+    def list(self, request, *args, **kwargs):
+        # public and identical for every caller of the same URL (filters and
+        # page live in the query string); forum.signals bumps the version on writes
+        uri = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+        key = CATEGORY_LIST_CACHE_KEY.format(category_list_version(), uri)
+        data = cache.get(key)
+        if data is None:
+            queryset = self.filter_queryset(self.get_queryset())
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                data = self.get_paginated_response(self.get_serializer(page, many=True).data).data
+            else:
+                data = list(self.get_serializer(queryset, many=True).data)
+            cache.set(key, data, CATEGORY_LIST_CACHE_TTL)
+        return Response(data)
+
 
 @extend_schema(tags=["Forum Threads"])
 class ThreadViewSet(viewsets.ModelViewSet):
@@ -36,10 +84,31 @@ class ThreadViewSet(viewsets.ModelViewSet):
     ordering_fields = ['created_at', 'updated_at', 'views']
 
     def get_queryset(self):
+        qs = (
+            Thread.objects
+            .select_related('category', 'author')
+            .annotate(
+                last_activity=Coalesce(Max('replies__created_at'), F('created_at')),
+                reply_count_ann=Count('replies'),
+            )
+        )
+        user = self.request.user
+        if user.is_authenticated:
+            qs = qs.annotate(is_subscribed=Exists(
+                ThreadSubscription.objects.filter(user=user, thread=OuterRef('pk'))
+            ))
+        else:
+            qs = qs.annotate(is_subscribed=Value(False))
+        if self.action == 'list':
+            # ThreadListSerializer never renders the (large) body
+            qs = qs.defer('content')
+        elif self.action == 'retrieve':
+            # part of the detail cache key; reply edits move it without any signal
+            qs = qs.annotate(replies_updated=Max('replies__updated_at'))
         category_slug = self.request.query_params.get('category_slug')
         if category_slug:
-            return Thread.objects.filter(category__slug=category_slug)
-        return Thread.objects.all()
+            qs = qs.filter(category__slug=category_slug)
+        return qs
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -57,9 +126,50 @@ class ThreadViewSet(viewsets.ModelViewSet):
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
+        # atomic single-column bump; no read-modify-write race, no full-row save
+        Thread.objects.filter(pk=instance.pk).update(views=F('views') + 1)
         instance.views += 1
-        instance.save()
-        return super().retrieve(request, *args, **kwargs)
+
+        # The user-independent payload (thread + nested replies) is cached per
+        # thread. Its key carries a version bumped on writes (forum.signals /
+        # invalidate_thread_detail) and a stamp read off the row itself, so
+        # every worker sees a change on the next request. Views, the category's
+        # thread count and the per-user flags are layered on top every time.
+        stamp = "{}-{}-{}".format(
+            instance.updated_at.isoformat(),
+            instance.replies_updated.isoformat() if instance.replies_updated else "",
+            instance.reply_count_ann,
+        )
+        key = THREAD_DETAIL_CACHE_KEY.format(instance.pk, thread_detail_version(instance.pk), stamp)
+        data = cache.get(key)
+        if data is None:
+            prefetch_related_objects([instance], Prefetch('replies', queryset=reply_queryset()))
+            data = self.get_serializer(instance).data
+            cache.set(key, data, THREAD_DETAIL_CACHE_TTL)
+
+        data['category']['thread_count'] = instance.category.threads.count()
+        data['views'] = instance.views
+        data['is_subscribed'] = instance.is_subscribed
+        my_votes = {}
+        if request.user.is_authenticated:
+            my_votes = dict(
+                ThreadReplyVote.objects
+                .filter(user=request.user, reply__thread=instance)
+                .values_list('reply_id', 'vote_type')
+            )
+        for reply in data['replies']:
+            reply['current_user_vote'] = my_votes.get(reply['id'])
+        return Response(data)
+
+    def update(self, request, *args, **kwargs):
+        partial = kwargs.pop('partial', False)
+        instance = self.get_object()
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        self.perform_update(serializer)
+        # nested replies need the same annotations as on retrieve
+        prefetch_related_objects([instance], Prefetch('replies', queryset=reply_queryset(request.user)))
+        return Response(serializer.data)
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def subscribe(self, request, slug=None):
@@ -89,29 +199,29 @@ class ThreadViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAdminUser])
     def pin(self, request, slug=None):
         thread = self.get_object()
-        thread.is_pinned = True
-        thread.save()
+        Thread.objects.filter(pk=thread.pk).update(is_pinned=True)
+        invalidate_thread_detail(thread.pk)
         return Response({'status': 'pinned'}, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAdminUser])
     def unpin(self, request, slug=None):
         thread = self.get_object()
-        thread.is_pinned = False
-        thread.save()
+        Thread.objects.filter(pk=thread.pk).update(is_pinned=False)
+        invalidate_thread_detail(thread.pk)
         return Response({'status': 'unpinned'}, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAdminUser])
     def lock(self, request, slug=None):
         thread = self.get_object()
-        thread.is_locked = True
-        thread.save()
+        Thread.objects.filter(pk=thread.pk).update(is_locked=True)
+        invalidate_thread_detail(thread.pk)
         return Response({'status': 'locked'}, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAdminUser])
     def unlock(self, request, slug=None):
         thread = self.get_object()
-        thread.is_locked = False
-        thread.save()
+        Thread.objects.filter(pk=thread.pk).update(is_locked=False)
+        invalidate_thread_detail(thread.pk)
         return Response({'status': 'unlocked'}, status=status.HTTP_200_OK)
 
 
@@ -121,6 +231,13 @@ class ReplyViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['thread', 'author', 'is_solution']
 
+    def get_queryset(self):
+        qs = reply_queryset(self.request.user)
+        if self.action not in ('list', 'retrieve'):
+            # IsThreadNotLocked / mark_solution read reply.thread
+            qs = qs.select_related('thread')
+        return qs
+
     def get_serializer_class(self):
         if self.action == 'create':
             return ThreadReplyCreateSerializer
@@ -141,10 +258,19 @@ class ReplyViewSet(viewsets.ModelViewSet):
         if vote_type not in [1, -1]:
             return Response({'error': 'Invalid vote type'}, status=status.HTTP_400_BAD_REQUEST)
 
-        vote, created = ThreadReplyVote.objects.update_or_create(
-            user=request.user,
-            reply=reply,
-            defaults={'vote_type': vote_type}
+        # single INSERT ... ON CONFLICT (user, reply) DO UPDATE
+        ThreadReplyVote.objects.bulk_create(
+            [ThreadReplyVote(user=request.user, reply=reply, vote_type=vote_type)],
+            update_conflicts=True,
+            unique_fields=['user', 'reply'],
+            update_fields=['vote_type', 'updated_at'],
+        )
+        invalidate_thread_detail(reply.thread_id)
+
+        # the in-memory object has no id on some backends and, for an updated
+        # vote, the wrong created_at – read back the stored row
+        vote = ThreadReplyVote.objects.only('id', 'vote_type', 'created_at').get(
+            user=request.user, reply=reply,
         )
 
         serializer = VoteSerializer(vote)
@@ -156,18 +282,18 @@ class ReplyViewSet(viewsets.ModelViewSet):
         thread = reply.thread
 
         # Only thread author or admin can mark solution
-        if request.user != thread.author and not request.user.is_staff:
+        if request.user.pk != thread.author_id and not request.user.is_staff:
             return Response({'error': 'Not authorized'}, status=status.HTTP_403_FORBIDDEN)
 
         # Reset any existing solution
         thread.replies.filter(is_solution=True).update(is_solution=False)
 
         # Mark this reply as solution
-        reply.is_solution = True
-        reply.save()
+        ThreadReply.objects.filter(pk=reply.pk).update(is_solution=True)
+        invalidate_thread_detail(thread.pk)
 
         # Notify the reply author
-        if reply.author != request.user:
+        if reply.author_id != request.user.pk:
             ForumNotification.objects.create(
                 recipient=reply.author,
                 thread=thread,
@@ -178,13 +304,25 @@ class ReplyViewSet(viewsets.ModelViewSet):
         return Response({'status': 'marked as solution'}, status=status.HTTP_200_OK)
 
 
+class NotificationCursorPagination(CursorPagination):
+    # keyset pagination: each page seeks on created_at instead of OFFSET-scanning
+    page_size = 50
+    ordering = '-created_at'
+
+
 @extend_schema(tags=["Forum Notifications"])
 class ForumNotificationViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = ForumNotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NotificationCursorPagination
 
     def get_queryset(self):
-        return ForumNotification.objects.filter(recipient=self.request.user).order_by('-created_at')
+        return (
+            ForumNotification.objects
+            .filter(recipient=self.request.user)
+            .select_related('thread')
+            .order_by('-created_at')
+        )
 
     @action(detail=True, methods=['post'])
     def mark_read(self, request, pk=None):
@@ -195,5 +333,6 @@ class ForumNotificationViewSet(viewsets.ReadOnlyModelViewSet):
 
     @action(detail=False, methods=['post'])
     def mark_all_read(self, request):
-        self.get_queryset().update(is_read=True)
+        # only touch unread rows; skip the list ordering
+        ForumNotification.objects.filter(recipient=request.user, is_read=False).update(is_read=True)
         return Response({'status': 'all marked as read'})
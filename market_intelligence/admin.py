@@ -1,5 +1,7 @@
 # market_intelligence/admin.py
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import Count
 from django.utils.html import format_html
 
 from . import models
@@ -13,28 +15,38 @@ class RegionAdmin(admin.ModelAdmin):
     list_display = ("name", "district_count")
     search_fields = ("name",)
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_district_count=Count("district"))
+
     def district_count(self, obj):
-        return obj.district_set.count()
+        return obj._district_count
 
     district_count.short_description = "Districts"
+    district_count.admin_order_field = "_district_count"
 
 
 @admin.register(models.District)
 class DistrictAdmin(admin.ModelAdmin):
     list_display = ("name", "region", "town_count")
     list_filter = ("region",)
+    list_select_related = ("region",)
     search_fields = ("name", "region__name")
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_town_count=Count("town"))
+
     def town_count(self, obj):
-        return obj.town_set.count()
+        return obj._town_count
 
     town_count.short_description = "Towns"
+    town_count.admin_order_field = "_town_count"
 
 
 @admin.register(models.Town)
 class TownAdmin(admin.ModelAdmin):
     list_display = ("name", "district", "region")
     list_filter = ("district__region", "district")
+    list_select_related = ("district__region",)
     search_fields = ("name", "district__name", "district__region__name")
 
     def region(self, obj):
@@ -47,6 +59,7 @@ class TownAdmin(admin.ModelAdmin):
 class MarketAdmin(admin.ModelAdmin):
     list_display = ("name", "town", "district", "region")
     list_filter = ("town__district__region", "town__district")
+    list_select_related = ("town__district__region",)
     search_fields = ("name", "town__name",
                      "town__district__name", "town__district__region__name")
 
@@ -95,10 +108,10 @@ class ProductAdmin(admin.ModelAdmin):
     inlines = (ProductImageInline,)
 
     def get_queryset(self, request):
-        return super().get_queryset(request).prefetch_related("tags")
+        return super().get_queryset(request).prefetch_related("tags").defer("description")
 
     def tag_list(self, obj):
-        return ", ".join(obj.tags.values_list("name", flat=True))
+        return ", ".join(t.name for t in obj.tags.all())
 
     tag_list.short_description = "Tags"
 
@@ -118,10 +131,10 @@ class ServiceAdmin(admin.ModelAdmin):
     inlines = (ServiceImageInline,)
 
     def get_queryset(self, request):
-        return super().get_queryset(request).prefetch_related("tags")
+        return super().get_queryset(request).prefetch_related("tags").defer("description")
 
     def tag_list(self, obj):
-        return ", ".join(obj.tags.values_list("name", flat=True))
+        return ", ".join(t.name for t in obj.tags.all())
 
     tag_list.short_description = "Tags"
 
@@ -136,10 +149,25 @@ class PriceHistoryInline(admin.TabularInline):
     fields = ("price", "currency", "recorded_at")
     readonly_fields = fields
     can_delete = False
+    max_num = 50  # most recent snapshots only, see PriceListingAdmin
 
     def has_add_permission(self, *args, **kwargs):
         return False
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).order_by("-recorded_at")
+
+
+class PriceListingChangeList(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):
+        # only the columns the changelist renders; the change form keeps full rows
+        return super().get_queryset(request, exclude_parameters).only(
+            "kind", "price", "currency", "average_price",
+            "lowest_price", "highest_price", "status", "updated_at",
+            "product__name", "service__name",
+            "market__display_name", "town__display_name",
+        )
+
 
 @admin.register(models.PriceListing)
 class PriceListingAdmin(admin.ModelAdmin):
@@ -149,7 +177,7 @@ class PriceListingAdmin(admin.ModelAdmin):
         "market", "town", "status", "updated_at",
     )
     list_filter = (
-        "status",
+        "status", "kind",
         "market__town__district__region",
         "product__category", "service__category",
     )
@@ -157,25 +185,52 @@ class PriceListingAdmin(admin.ModelAdmin):
         "product__name", "service__name",
         "market__name", "town__name",
     )
-    autocomplete_fields = ("product", "service", "town", "market")
+    autocomplete_fields = ("product", "service")
+    raw_id_fields = ("town", "market")
     inlines = (PriceHistoryInline,)
+    actions = ("recalculate_stats",)
+    list_per_page = 50
 
     def stem(self, obj):
-        return obj.product or obj.service
+        return obj.product if obj.product_id else obj.service
 
     stem.short_description = "Product / Service"
 
+    def get_formset_kwargs(self, request, obj, inline, prefix):
+        kwargs = super().get_formset_kwargs(request, obj, inline, prefix)
+        if isinstance(inline, PriceHistoryInline) and obj is not None and obj.pk:
+            # the formset filters by listing itself, so the cap goes in a subquery
+            recent = (
+                models.PriceHistory.objects.filter(listing=obj)
+                .order_by("-recorded_at")
+                .values("pk")[:inline.max_num]
+            )
+            kwargs["queryset"] = kwargs["queryset"].filter(pk__in=recent)
+        return kwargs
+
+    @admin.action(description="Recalculate stats from price history")
+    def recalculate_stats(self, request, queryset):
+        updated = 0
+        # "select all" can cover the whole table – stream it in bounded chunks
+        # without the changelist joins; the rebuild needs only pk and price
+        for listing in queryset.select_related(None).only("id", "price").iterator(chunk_size=500):
+            listing.recalculate_stats()
+            updated += 1
+        self.message_user(request, f"Recalculated {updated} listing(s).")
+
     def get_queryset(self, request):
         return (
             super()
             .get_queryset(request)
             .select_related(
                 "product", "service",
-                "market", "market__town",
-                "town",
+                "market", "town",
             )
         )
 
+    def get_changelist(self, request, **kwargs):
+        return PriceListingChangeList
+
 
 # ────────────────────────────────────────────────────────────
 # 5.  PRICE HISTORY (stand-alone view, read-only)
@@ -184,6 +239,11 @@ class PriceListingAdmin(admin.ModelAdmin):
 class PriceHistoryAdmin(admin.ModelAdmin):
     list_display = ("listing", "price", "currency", "recorded_at")
     list_filter = ("currency", "listing__market__town__district__region")
+    # the listing's __str__ reads its stem and the market/town display_name only
+    list_select_related = (
+        "listing__product", "listing__service",
+        "listing__market", "listing__town",
+    )
     search_fields = ("listing__product__name",
                      "listing__service__name",
                      "listing__market__name")
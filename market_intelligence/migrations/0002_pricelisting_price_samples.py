@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-16 11:20
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_price_samples(apps, schema_editor):
+    PriceListing = apps.get_model('market_intelligence', 'PriceListing')
+    PriceHistory = apps.get_model('market_intelligence', 'PriceHistory')
+    samples = (
+        PriceHistory.objects.filter(listing=OuterRef('pk'))
+        .order_by()
+        .values('listing')
+        .annotate(n=Count('id'))
+        .values('n')
+    )
+    PriceListing.objects.update(price_samples=Coalesce(Subquery(samples), 1))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market_intelligence', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pricelisting',
+            name='price_samples',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.RunPython(backfill_price_samples, migrations.RunPython.noop),
+    ]
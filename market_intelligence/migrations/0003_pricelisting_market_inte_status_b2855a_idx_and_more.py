@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-16 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market_intelligence', '0002_pricelisting_price_samples'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pricelisting',
+            index=models.Index(fields=['status', 'product'], name='market_inte_status_b2855a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pricelisting',
+            index=models.Index(fields=['status', 'service'], name='market_inte_status_dce946_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pricelisting',
+            index=models.Index(fields=['-updated_at'], name='market_inte_updated_0760f0_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-16 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market_intelligence', '0003_pricelisting_market_inte_status_b2855a_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pricelisting',
+            name='kind',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(product__isnull=False, then=models.Value('Product')), default=models.Value('Service')), output_field=models.CharField(max_length=8)),
+        ),
+        migrations.AddIndex(
+            model_name='pricelisting',
+            index=models.Index(fields=['kind'], name='market_inte_kind_ff12b3_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2 on 2026-10-16 12:55
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+RECORDED_AT_BRIN = django.contrib.postgres.indexes.BrinIndex(
+    fields=['recorded_at'], name='market_inte_recorde_1c504e_brin', pages_per_range=32,
+)
+
+
+def add_brin_index(apps, schema_editor):
+    # BRIN is postgres-only
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('market_intelligence', 'PriceHistory'), RECORDED_AT_BRIN)
+
+
+def remove_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.remove_index(apps.get_model('market_intelligence', 'PriceHistory'), RECORDED_AT_BRIN)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market_intelligence', '0005_alter_pricehistory_recorded_at'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='pricehistory', index=RECORDED_AT_BRIN),
+            ],
+            database_operations=[
+                migrations.RunPython(add_brin_index, remove_brin_index),
+            ],
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2 on 2026-10-16 13:15
+
+from django.db import migrations, models
+
+
+def backfill_display_names(apps, schema_editor):
+    # parents first so each level can read the one above
+    for model_name, parent in (('District', 'region'), ('Town', 'district'), ('Market', 'town')):
+        model = apps.get_model('market_intelligence', model_name)
+        rows = list(model.objects.select_related(parent))
+        for row in rows:
+            up = getattr(row, parent)
+            name = row.name or ''
+            row.display_name = f"{name}, {up.name or ''}" if up is not None else name
+        model.objects.bulk_update(rows, ['display_name'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market_intelligence', '0006_pricehistory_market_inte_recorde_1c504e_brin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='district',
+            name='display_name',
+            field=models.CharField(default='', editable=False, max_length=512),
+        ),
+        migrations.AddField(
+            model_name='market',
+            name='display_name',
+            field=models.CharField(default='', editable=False, max_length=512),
+        ),
+        migrations.AddField(
+            model_name='town',
+            name='display_name',
+            field=models.CharField(default='', editable=False, max_length=512),
+        ),
+        migrations.RunPython(backfill_display_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2 on 2026-10-16 14:20
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+SEARCH_INDEXES = {
+    'product': (
+        django.contrib.postgres.indexes.GinIndex(
+            fields=['name', 'description'], name='mi_product_trgm_idx', opclasses=['gin_trgm_ops', 'gin_trgm_ops'],
+        ),
+        models.Index(
+            django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='text_pattern_ops'),
+            name='mi_product_name_prefix_idx',
+        ),
+    ),
+    'service': (
+        django.contrib.postgres.indexes.GinIndex(
+            fields=['name', 'description'], name='mi_service_trgm_idx', opclasses=['gin_trgm_ops', 'gin_trgm_ops'],
+        ),
+        models.Index(
+            django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='text_pattern_ops'),
+            name='mi_service_name_prefix_idx',
+        ),
+    ),
+}
+
+
+def add_search_indexes(apps, schema_editor):
+    # pg_trgm / operator classes only exist on postgres; the sqlite dev database skips them
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name, indexes in SEARCH_INDEXES.items():
+        model = apps.get_model('market_intelligence', model_name)
+        for index in indexes:
+            schema_editor.add_index(model, index)
+
+
+def remove_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name, indexes in SEARCH_INDEXES.items():
+        model = apps.get_model('market_intelligence', model_name)
+        for index in indexes:
+            schema_editor.remove_index(model, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market_intelligence', '0007_location_display_name'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name=model_name, index=index)
+                for model_name, indexes in SEARCH_INDEXES.items()
+                for index in indexes
+            ],
+            database_operations=[
+                migrations.RunPython(add_search_indexes, remove_search_indexes),
+            ],
+        ),
+    ]
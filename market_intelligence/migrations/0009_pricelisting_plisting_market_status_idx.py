@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-16 15:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market_intelligence', '0008_product_service_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pricelisting',
+            index=models.Index(fields=['market', 'status'], include=('product', 'service'), name='plisting_market_status_idx'),
+        ),
+    ]
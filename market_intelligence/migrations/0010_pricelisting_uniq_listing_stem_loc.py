@@ -0,0 +1,60 @@
+# Generated by Django 5.2 on 2026-10-16 16:10
+
+from django.db import migrations, models
+from django.db.models import Avg, Count, Max, Min, Value
+from django.db.models.functions import Coalesce
+
+KEY = ('product', 'service', 'market', 'town')
+
+
+def merge_duplicate_listings(apps, schema_editor):
+    """
+    Collapse listings that share stem + location (NULLs equal) into the most
+    recently updated one: history is moved onto it and its stats rebuilt.
+    """
+    PriceListing = apps.get_model('market_intelligence', 'PriceListing')
+    PriceHistory = apps.get_model('market_intelligence', 'PriceHistory')
+
+    groups = (
+        PriceListing.objects.values(*KEY)
+        .annotate(n=Count('id'))
+        .filter(n__gt=1)
+    )
+    for group in groups:
+        lookup = {}
+        for field in KEY:
+            if group[field] is None:
+                lookup[f'{field}__isnull'] = True
+            else:
+                lookup[field] = group[field]
+        keep, *dupes = PriceListing.objects.filter(**lookup).order_by('-updated_at', '-id')
+        dupe_ids = [d.pk for d in dupes]
+        PriceHistory.objects.filter(listing_id__in=dupe_ids).update(listing=keep)
+        PriceListing.objects.filter(pk__in=dupe_ids).delete()
+
+        agg = PriceHistory.objects.filter(listing=keep).aggregate(
+            avg=Avg('price'), lo=Min('price'), hi=Max('price'), n=Count('id'),
+        )
+        keep.average_price = agg['avg'] or keep.price
+        keep.lowest_price = agg['lo'] or keep.price
+        keep.highest_price = agg['hi'] or keep.price
+        keep.price_samples = agg['n'] or 1
+        keep.save(update_fields=['average_price', 'lowest_price', 'highest_price', 'price_samples'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market_intelligence', '0009_pricelisting_plisting_market_status_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_listings, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='pricelisting',
+            constraint=models.UniqueConstraint(
+                *(Coalesce(f, Value(0), output_field=models.BigIntegerField()) for f in KEY),
+                name='uniq_listing_stem_loc',
+            ),
+        ),
+    ]
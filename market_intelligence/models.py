@@ -1,9 +1,17 @@
+import logging
 from decimal import Decimal
 
+from django.contrib.postgres.indexes import BrinIndex, GinIndex, OpClass
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.db.models import CheckConstraint, Q, Avg, Min, Max
+from django.db import connection, models, transaction
+from django.db.models import CheckConstraint, Q, Avg, Min, Max, Count, Case, When, F, Value
+from django.db.models.functions import Coalesce, Least, Greatest, Now, Upper
 from django.utils import timezone
+from kombu.exceptions import OperationalError
+
+from .utils import invalidate_search_cache
+
+logger = logging.getLogger(__name__)
 
 
 # Create your models here.
@@ -14,28 +22,55 @@ class Region(models.Model):
         return self.name
 
 
+def _display_name(name, parent):
+    name = name or ""
+    return f"{name}, {parent.name or ''}" if parent is not None else name
+
+
 class District(models.Model):
     name = models.CharField(max_length=255, null=True, blank=True)
     region = models.ForeignKey(Region, on_delete=models.CASCADE, null=True, blank=True)
+    # "name, region" – kept in sync by save() and the region rename signal
+    display_name = models.CharField(max_length=512, editable=False, default="")
+
+    def save(self, *args, **kwargs):
+        self.display_name = _display_name(self.name, self.region)
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "display_name"}
+        super().save(*args, **kwargs)
 
     def __str__(self):
-        return f"{self.name}, {self.region.name}"
+        return self.display_name
 
 
 class Town(models.Model):
     name = models.CharField(max_length=255, null=True, blank=True)
     district = models.ForeignKey(District, on_delete=models.CASCADE, null=True, blank=True)
+    display_name = models.CharField(max_length=512, editable=False, default="")
+
+    def save(self, *args, **kwargs):
+        self.display_name = _display_name(self.name, self.district)
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "display_name"}
+        super().save(*args, **kwargs)
 
     def __str__(self):
-        return f"{self.name}, {self.district.name}"
+        return self.display_name
 
 
 class Market(models.Model):
     name = models.CharField(max_length=255, null=True, blank=True)
     town = models.ForeignKey(Town, on_delete=models.CASCADE, null=True, blank=True)
+    display_name = models.CharField(max_length=512, editable=False, default="")
+
+    def save(self, *args, **kwargs):
+        self.display_name = _display_name(self.name, self.town)
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "display_name"}
+        super().save(*args, **kwargs)
 
     def __str__(self):
-        return f"{self.name}, {self.town.name}"
+        return self.display_name
 
 
 class Category(models.Model):
@@ -46,6 +81,22 @@ class Category(models.Model):
     def __str__(self):
         return self.name
 
+    def descendant_ids(self, include_self=True):
+        """Ids of every category below this one, in a single recursive query."""
+        table = connection.ops.quote_name(Category._meta.db_table)
+        sql = f"""
+            WITH RECURSIVE subtree(id) AS (
+                SELECT id FROM {table} WHERE id = %s
+                UNION ALL
+                SELECT c.id FROM {table} c JOIN subtree s ON c.parent_id = s.id
+            )
+            SELECT id FROM subtree
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [self.pk])
+            ids = [row[0] for row in cursor.fetchall()]
+        return ids if include_self else [pk for pk in ids if pk != self.pk]
+
 
 class Tag(models.Model):
     name = models.CharField(max_length=255, unique=True, null=True, blank=True)
@@ -66,6 +117,18 @@ class Product(models.Model):
     category = models.ForeignKey(Category, on_delete=models.CASCADE)
     tags = models.ManyToManyField(Tag, blank=True)
 
+    class Meta:
+        indexes = [
+            # trigram index backing GlobalSearchView's fuzzy `q` (postgres only)
+            GinIndex(
+                fields=["name", "description"],
+                name="mi_product_trgm_idx",
+                opclasses=["gin_trgm_ops", "gin_trgm_ops"],
+            ),
+            # UPPER(name) LIKE 'Q%' – the istartswith autocomplete (postgres only)
+            models.Index(OpClass(Upper("name"), name="text_pattern_ops"), name="mi_product_name_prefix_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -82,6 +145,18 @@ class Service(models.Model):
     category = models.ForeignKey(Category, on_delete=models.CASCADE)
     tags = models.ManyToManyField(Tag, blank=True)
 
+    class Meta:
+        indexes = [
+            # trigram index backing GlobalSearchView's fuzzy `q` (postgres only)
+            GinIndex(
+                fields=["name", "description"],
+                name="mi_service_trgm_idx",
+                opclasses=["gin_trgm_ops", "gin_trgm_ops"],
+            ),
+            # UPPER(name) LIKE 'Q%' – the istartswith autocomplete (postgres only)
+            models.Index(OpClass(Upper("name"), name="text_pattern_ops"), name="mi_service_name_prefix_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -94,6 +169,24 @@ class ProductServiceImage(models.Model):
     status = models.BooleanField(default=True)
 
 
+def _queue_price_snapshot(listing_id, price, currency, recorded_at):
+    """
+    Hand the history snapshot to Celery. The listing row is already committed
+    here, so a broker outage must not fail the request: write it inline instead.
+    """
+    from .tasks import record_price_change  # local import – tasks imports models
+
+    try:
+        record_price_change.delay(listing_id, price, currency, recorded_at)
+    except OperationalError:
+        logger.warning("broker unavailable; recording price snapshot for listing %s inline", listing_id)
+        try:
+            record_price_change(listing_id, price, currency, recorded_at)
+        except Exception:
+            # stats are still folded on the row; only this history point is lost
+            logger.exception("could not record price snapshot for listing %s", listing_id)
+
+
 class PriceListing(models.Model):
     """
     A single row represents:
@@ -152,6 +245,16 @@ class PriceListing(models.Model):
         decimal_places=2,
         editable=False,
     )
+    # number of price points folded into average_price
+    price_samples = models.PositiveIntegerField(default=1, editable=False)
+    kind = models.GeneratedField(
+        expression=Case(
+            When(product__isnull=False, then=Value("Product")),
+            default=Value("Service"),
+        ),
+        output_field=models.CharField(max_length=8),
+        db_persist=True,
+    )
     note = models.TextField(blank=True)
     status = models.BooleanField(default=True)  # active/hidden
     updated_at = models.DateTimeField(auto_now=True)
@@ -171,23 +274,41 @@ class PriceListing(models.Model):
                 check=Q(town__isnull=False) | Q(market__isnull=False),
                 name="price_listing_needs_town_or_market",
             ),
+            # one listing per stem and location. Every row has NULLs (the other
+            # stem, and usually town or market) and those must compare equal, so
+            # the index is over COALESCE(col, 0) – works on any postgres and sqlite
+            models.UniqueConstraint(
+                *(
+                    Coalesce(f, Value(0), output_field=models.BigIntegerField())
+                    for f in ("product", "service", "market", "town")
+                ),
+                name="uniq_listing_stem_loc",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=("status", "product")),
+            models.Index(fields=("status", "service")),
+            models.Index(fields=("-updated_at",)),
+            models.Index(fields=("kind",)),
+            # MarketProductView: market_id + status, stem ids read off the index (INCLUDE is postgres-only)
+            models.Index(
+                fields=("market", "status"),
+                include=("product", "service"),
+                name="plisting_market_status_idx",
+            ),
         ]
 
     def clean(self):
         super().clean()
-        if bool(self.product) == bool(self.service):
+        if bool(self.product_id) == bool(self.service_id):
             raise ValidationError(
                 "Exactly one of product OR service must be provided."
             )
-        if not (self.town or self.market):
+        if not (self.town_id or self.market_id):
             raise ValidationError(
                 "A listing needs a town and/or a market reference."
             )
 
-    @property
-    def kind(self) -> str:
-        return "Product" if self.product_id else "Service"
-
     def __str__(self):
         stem = self.product or self.service
         where = self.market or self.town or "—"
@@ -195,36 +316,136 @@ class PriceListing(models.Model):
 
     def _recalc_stats(self):
         agg = self.history.aggregate(
-            avg=Avg("price"), lo=Min("price"), hi=Max("price")
+            avg=Avg("price"), lo=Min("price"), hi=Max("price"), n=Count("id")
         )
         self.average_price = agg.get("avg") or self.price
         self.lowest_price = agg.get("lo") or self.price
         self.highest_price = agg.get("hi") or self.price
+        self.price_samples = agg.get("n") or 1
+
+    def recalculate_stats(self):
+        """Rebuild the aggregates from the full price history."""
+        self._recalc_stats()
+        super().save(update_fields=(
+            "average_price", "lowest_price", "highest_price", "price_samples"
+        ))
+
+    def _fold_price(self):
+        # running min / max / mean – no history scan needed
+        n = self.price_samples or 1
+        self.lowest_price = min(self.lowest_price, self.price)
+        self.highest_price = max(self.highest_price, self.price)
+        self.average_price = (
+            (self.average_price * n + self.price) / (n + 1)
+        ).quantize(Decimal("0.01"))
+        self.price_samples = n + 1
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # the stored price, so save() can tell a price edit from any other write
+        instance._loaded_price = instance.__dict__.get("price")
+        return instance
+
+    def _price_changed(self, update_fields):
+        if update_fields is not None and "price" not in update_fields:
+            return False  # the price column is not being written
+        loaded = getattr(self, "_loaded_price", None)
+        if loaded is None:
+            # built by hand or loaded with price deferred – trust an explicit update_fields
+            return update_fields is not None
+        return self.price != loaded
 
     def save(self, *args, **kwargs):
         is_new = self._state.adding
+        update_fields = kwargs.get("update_fields")
 
-        # pre-populate stats on create
         if is_new:
+            # pre-populate stats on create
             initial = self.price or Decimal("0.00")
             self.average_price = initial
             self.lowest_price = initial
             self.highest_price = initial
+            self.price_samples = 1
+            price_changed = True
+        else:
+            price_changed = self._price_changed(update_fields)
+            if price_changed:
+                self._fold_price()
+                if update_fields is not None:
+                    kwargs["update_fields"] = {
+                        *update_fields,
+                        "average_price", "lowest_price", "highest_price", "price_samples",
+                    }
 
         super().save(*args, **kwargs)
+        self._loaded_price = self.price
 
-        price_changed = is_new or ("price" in (kwargs.get("update_fields") or []))
         if price_changed:
-            PriceHistory.objects.create(
-                listing=self,
-                price=self.price,
-                currency=self.currency,
-                recorded_at=timezone.now(),
+            # the snapshot is written by a worker once this transaction commits
+            args = (self.pk, str(self.price), self.currency, timezone.now().isoformat())
+            transaction.on_commit(lambda: _queue_price_snapshot(*args))
+
+    @classmethod
+    def bulk_create_with_history(cls, listings, batch_size=1000):
+        """
+        Insert new listings and their opening history rows in batches.
+        save() and its signals are bypassed, so stats are seeded here.
+        """
+        listings = list(listings)
+        for listing in listings:
+            listing.average_price = listing.lowest_price = listing.highest_price = listing.price
+            listing.price_samples = 1
+
+        with transaction.atomic():
+            created = cls.objects.bulk_create(listings, batch_size=batch_size)
+            PriceHistory.objects.bulk_create(
+                [PriceHistory(listing=l, price=l.price, currency=l.currency) for l in created],
+                batch_size=batch_size,
+            )
+            transaction.on_commit(invalidate_search_cache)
+        return created
+
+    @classmethod
+    def bulk_update_prices(cls, rows):
+        """
+        Apply many price changes at once.
+        `rows` is an iterable of (listing_id, new_price) pairs. Writes one
+        history batch and one UPDATE; save() and its signals are bypassed.
+        """
+        prices = {pk: Decimal(str(price)) for pk, price in rows}
+        if not prices:
+            return 0
+
+        with transaction.atomic():
+            currencies = dict(
+                cls.objects.select_for_update()
+                .filter(pk__in=prices)
+                .values_list("pk", "currency")
+            )
+            if not currencies:
+                return 0
+            new_price = Case(
+                *(When(pk=pk, then=Value(prices[pk])) for pk in currencies),
+                output_field=models.DecimalField(max_digits=10, decimal_places=2),
+            )
+            PriceHistory.objects.bulk_create(
+                [
+                    PriceHistory(listing_id=pk, price=prices[pk], currency=currency)
+                    for pk, currency in currencies.items()
+                ],
+                batch_size=1000,
+            )
+            transaction.on_commit(invalidate_search_cache)
+            return cls.objects.filter(pk__in=currencies).update(
+                price=new_price,
+                lowest_price=Least(F("lowest_price"), new_price),
+                highest_price=Greatest(F("highest_price"), new_price),
+                average_price=(F("average_price") * F("price_samples") + new_price)
+                / (F("price_samples") + 1),
+                price_samples=F("price_samples") + 1,
+                updated_at=Now(),
             )
-            self._recalc_stats()
-            super().save(update_fields=(
-                "average_price", "lowest_price", "highest_price"
-            ))
 
 
 class PriceHistory(models.Model):
@@ -235,12 +456,14 @@ class PriceHistory(models.Model):
     )
     price = models.DecimalField(max_digits=10, decimal_places=2)
     currency = models.CharField(max_length=10)
-    recorded_at = models.DateTimeField(default=timezone.now)
+    recorded_at = models.DateTimeField(db_default=Now())
 
     class Meta:
         get_latest_by = "recorded_at"
         indexes = [
             models.Index(fields=("listing", "recorded_at")),
+            # history is append-only, so recorded_at follows physical order
+            BrinIndex(fields=("recorded_at",), pages_per_range=32),
         ]
         verbose_name_plural = "Price history"
 
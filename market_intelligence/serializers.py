@@ -1,6 +1,13 @@
 # market_intel/serializers.py
+import copy
+from itertools import groupby
+from operator import attrgetter, itemgetter
+from statistics import fmean
+
+from django.db.models import FloatField, Prefetch
+from django.db.models.functions import Cast, ExtractMonth, ExtractYear
 from rest_framework import serializers
-import pandas as pd
+import numpy as np
 
 from core.utils import date_breakdown  # unchanged helper
 from .models import (  # ONLY live models
@@ -10,6 +17,25 @@ from .models import (  # ONLY live models
     PriceListing, PriceHistory
 )
 
+_FIELD_CACHE = {}
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer class's fields once and hand each instance deep copies
+    (Field.__deepcopy__ just re-instantiates from the stored args, so relational
+    children such as ManyRelatedField.child_relation are never shared). Nested/
+    method serializers are instantiated per object here, so DRF would otherwise
+    re-run the ModelSerializer field introspection.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        fields = _FIELD_CACHE.get(cls)
+        if fields is None:
+            fields = _FIELD_CACHE[cls] = super().get_fields()
+        return copy.deepcopy(fields)
+
 
 # ──────────────────────────────────────────
 # 1.  LOCATION  (unchanged)
@@ -56,19 +82,27 @@ class MarketSerializer(serializers.ModelSerializer):
 # ──────────────────────────────────────────
 # 2.  CATEGORY  /  TAGS
 # ──────────────────────────────────────────
-class ProductBriefSerializer(serializers.ModelSerializer):
+class ProductBriefSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Product
         fields = ("id", "name")
 
 
-class ServiceBriefSerializer(serializers.ModelSerializer):
+class ServiceBriefSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Service
         fields = ("id", "name")
 
 
-class CategorySerializer(serializers.ModelSerializer):
+# tree levels covered by CategorySerializer.prefetch_queryset; deeper nodes query lazily
+CATEGORY_PREFETCH_DEPTH = 4
+
+
+def _is_prefetched(obj, name):
+    return name in getattr(obj, "_prefetched_objects_cache", {})
+
+
+class CategorySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     products_and_services = serializers.SerializerMethodField()
     children = serializers.SerializerMethodField()
 
@@ -76,16 +110,41 @@ class CategorySerializer(serializers.ModelSerializer):
         model = Category
         fields = ("id", "name", "image", "parent", "products_and_services", "children")
 
+    @classmethod
+    def prefetch_queryset(cls, qs, depth=CATEGORY_PREFETCH_DEPTH):
+        """Prefetch children + stems for `depth` levels – 3 queries per level."""
+        lookups = []
+        path = ""
+        for _ in range(depth):
+            lookups += [
+                Prefetch(f"{path}product_set", queryset=Product.objects.only("id", "name", "category_id")),
+                Prefetch(f"{path}service_set", queryset=Service.objects.only("id", "name", "category_id")),
+                Prefetch(f"{path}category_set", queryset=Category.objects.order_by("name")),
+            ]
+            path += "category_set__"
+        return qs.prefetch_related(*lookups)
+
     # direct children
     def get_products_and_services(self, obj):
         return {
-            "products": ProductBriefSerializer(Product.objects.filter(category=obj), many=True).data,
-            "services": ServiceBriefSerializer(Service.objects.filter(category=obj), many=True).data,
+            "products": ProductBriefSerializer(obj.product_set.all(), many=True).data,
+            "services": ServiceBriefSerializer(obj.service_set.all(), many=True).data,
         }
 
     # recursive
     def get_children(self, obj):
-        return CategorySerializer(obj.category_set.all().order_by("name"), many=True).data
+        children = obj.category_set.all()
+        if not _is_prefetched(obj, "category_set"):
+            children = children.order_by("name")
+        return CategorySerializer(children, many=True, context=self.context).data
+
+
+class CategoryBriefSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Flat category for embedding in stems – no tree walk."""
+
+    class Meta:
+        model = Category
+        fields = ("id", "name", "parent")
 
 
 class CategoryDetailSerializer(CategorySerializer):
@@ -96,14 +155,7 @@ class CategoryDetailSerializer(CategorySerializer):
         fields = CategorySerializer.Meta.fields + ("all_products",)
 
     def get_all_products(self, obj):
-        leaf_ids = []
-
-        def crawl(node):
-            leaf_ids.append(node.id)
-            for ch in node.category_set.all():
-                crawl(ch)
-
-        crawl(obj)
+        leaf_ids = obj.descendant_ids()
 
         prods = Product.objects.filter(category_id__in=leaf_ids)
         servs = Service.objects.filter(category_id__in=leaf_ids)
@@ -122,13 +174,13 @@ class TagSerializer(serializers.ModelSerializer):
 # ──────────────────────────────────────────
 # 3.  COMMON  MINI  SERIALISERS
 # ──────────────────────────────────────────
-class TownMiniSerializer(serializers.ModelSerializer):
+class TownMiniSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Town
         fields = ("id", "name")
 
 
-class MarketMiniSerializer(serializers.ModelSerializer):
+class MarketMiniSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     town = TownMiniSerializer(read_only=True)
 
     class Meta:
@@ -136,7 +188,7 @@ class MarketMiniSerializer(serializers.ModelSerializer):
         fields = ("id", "name", "town")
 
 
-class StemMini(serializers.ModelSerializer):
+class StemMini(CachedFieldsMixin, serializers.ModelSerializer):
     """Tiny helper for Product & Service one-liners."""
     category = serializers.CharField(source="category.name")
     object_type = serializers.SerializerMethodField()
@@ -144,16 +196,22 @@ class StemMini(serializers.ModelSerializer):
     class Meta:
         fields = ("id", "name", "category", "object_type")
 
+    _OBJECT_TYPE = None  # set by each concrete serializer
+
     def get_object_type(self, obj):
-        return "Product" if isinstance(obj, Product) else "Service"
+        return self._OBJECT_TYPE
 
 
 class ProductMiniSerializer(StemMini):
+    _OBJECT_TYPE = "Product"
+
     class Meta(StemMini.Meta):
         model = Product
 
 
 class ServiceMiniSerializer(StemMini):
+    _OBJECT_TYPE = "Service"
+
     class Meta(StemMini.Meta):
         model = Service
 
@@ -161,8 +219,8 @@ class ServiceMiniSerializer(StemMini):
 # ──────────────────────────────────────────
 # 4.  PRICE-LISTING  OVERVIEW
 # ──────────────────────────────────────────
-class ListingOverviewSerializer(serializers.ModelSerializer):
-    kind = serializers.CharField(source="kind", read_only=True)
+class ListingOverviewSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    kind = serializers.CharField(read_only=True)
     product = ProductMiniSerializer(read_only=True)
     service = ServiceMiniSerializer(read_only=True)
     town = TownMiniSerializer(read_only=True)
@@ -189,31 +247,71 @@ class ImageSerializer(serializers.ModelSerializer):
         read_only_fields = ("id",)
 
 
-def _listing_qs_for_stem(stem):
-    """
-    Handy helper: returns active listings for a given Product *or* Service
-    including prefetch of last 90 history rows (for graphs).
-    """
+RECENT_HISTORY_POINTS = 90
+
+# the only PriceHistory columns the serializers read
+_HISTORY_COLUMNS = ("id", "listing_id", "price", "currency", "recorded_at")
+
+
+def _history_qs():
+    return PriceHistory.objects.only(*_HISTORY_COLUMNS)
+
+
+def _recent_history_qs():
+    # a sliced prefetch is limited per listing (ROW_NUMBER() window), not overall
+    return _history_qs().order_by("-recorded_at")[:RECENT_HISTORY_POINTS]
+
+
+# Product/Service columns the stem serializers read; the category image is never shown
+STEM_COLUMNS = (
+    "id", "name", "description", "sku",
+    "category__id", "category__name", "category__parent",
+)
+
+# what ListingOverviewSerializer reads – FK ids stay in so the prefetch joins resolve
+_LISTING_OVERVIEW_COLUMNS = (
+    "id", "kind", "product", "service",
+    "town__id", "town__name",
+    "market__id", "market__name", "market__town__id", "market__town__name",
+    "price", "currency", "average_price", "lowest_price", "highest_price",
+    "status", "updated_at",
+)
+
+
+def _active_listings_qs():
     return (
-        stem.listings
+        PriceListing.objects
         .filter(status=True)
         .select_related("town", "market", "market__town")
-        .prefetch_related(
-            "history",
-        )
+        .only(*_LISTING_OVERVIEW_COLUMNS)
+        # sliced prefetches need a to_attr – the manager cache would re-filter the slice
+        .prefetch_related(recent_history_prefetch())
     )
 
 
+def stem_listings_prefetch():
+    """
+    Prefetch for Product/Service querysets fed to the stem serializers:
+    active listings land on `active_listings`, each with its newest-first
+    history on `recent_history`.
+    """
+    return Prefetch("listings", queryset=_active_listings_qs(), to_attr="active_listings")
+
+
 def _listing_qs_for(obj):
-    return (
-        obj.listings
-        .filter(status=True)
-        .select_related("town", "market")
-        .prefetch_related("history")
-    )
+    """Active listings of a stem – from the prefetch when the view did one."""
+    listings = getattr(obj, "active_listings", None)
+    if listings is None:
+        listings = obj.active_listings = list(_active_listings_qs().filter(**{
+            "product" if isinstance(obj, Product) else "service": obj,
+        }))
+    return listings
+
 
+_by_price = attrgetter("price")
 
-class BaseStemSerializer(serializers.ModelSerializer):
+
+class BaseStemSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     listings = serializers.SerializerMethodField()
     price_summary = serializers.SerializerMethodField()
     location_curves = serializers.SerializerMethodField()
@@ -228,24 +326,26 @@ class BaseStemSerializer(serializers.ModelSerializer):
         ).data
 
     def get_price_summary(self, obj):
-        rows = [(l.id, l.price, l.currency) for l in obj.listings.all()]
-        if not rows:
+        # listings are already in memory for `listings`; an aggregate would only add queries
+        listings = _listing_qs_for(obj)
+        if not listings:
             return None
-        lo = min(rows, key=lambda x: x[1])
-        hi = max(rows, key=lambda x: x[1])
+        lo = min(listings, key=_by_price)
+        hi = max(listings, key=_by_price)
         return {
-            "cheapest": {"listing_id": lo[0], "price": float(lo[1]), "currency": lo[2]},
-            "priciest": {"listing_id": hi[0], "price": float(hi[1]), "currency": hi[2]},
-            "count": len(rows),
+            "cheapest": {"listing_id": lo.id, "price": float(lo.price), "currency": lo.currency},
+            "priciest": {"listing_id": hi.id, "price": float(hi.price), "currency": hi.currency},
+            "count": len(listings),
         }
 
     def get_location_curves(self, obj):
         data = {}
         for l in _listing_qs_for(obj):
-            pts = l.history.order_by("-recorded_at")[:90].values("price", "recorded_at")
+            # history is prefetched newest-first, already capped per listing
+            pts = l.recent_history
             if pts:
                 data[str(l.id)] = [
-                    {"price": float(p["price"]), "at": p["recorded_at"]} for p in pts
+                    {"price": float(p.price), "at": p.recorded_at} for p in pts
                 ]
         return data or None
 
@@ -253,9 +353,31 @@ class BaseStemSerializer(serializers.ModelSerializer):
         # overridden in subclasses to "Product" or "Service"
         raise NotImplementedError
 
+    # ---- writes: images go in one INSERT ------------------------------
+    _STEM_FIELD = None  # "product" / "service" FK on ProductServiceImage
+
+    def _add_images(self, stem, images):
+        if images:
+            ProductServiceImage.objects.bulk_create(
+                [ProductServiceImage(**{**img, self._STEM_FIELD: stem}) for img in images],
+                batch_size=100,
+            )
+
+    def create(self, validated_data):
+        images = validated_data.pop("images", None)
+        stem = super().create(validated_data)
+        self._add_images(stem, images)
+        return stem
+
+    def update(self, instance, validated_data):
+        images = validated_data.pop("images", None)
+        stem = super().update(instance, validated_data)
+        self._add_images(stem, images)
+        return stem
+
 
 class ProductSerializer(BaseStemSerializer):
-    category = CategorySerializer(read_only=True)
+    category = CategoryBriefSerializer(read_only=True)
     category_id = serializers.PrimaryKeyRelatedField(
         queryset=Category.objects.all(), source="category", write_only=True
     )
@@ -264,6 +386,7 @@ class ProductSerializer(BaseStemSerializer):
         many=True, source="tags", queryset=Tag.objects.all(), write_only=True
     )
     images = ImageSerializer(many=True, write_only=True, required=False)
+    _STEM_FIELD = "product"
 
     class Meta:
         model = Product
@@ -279,7 +402,7 @@ class ProductSerializer(BaseStemSerializer):
 
 
 class ServiceSerializer(BaseStemSerializer):
-    category = CategorySerializer(read_only=True)
+    category = CategoryBriefSerializer(read_only=True)
     category_id = serializers.PrimaryKeyRelatedField(
         queryset=Category.objects.all(), source="category", write_only=True
     )
@@ -288,6 +411,7 @@ class ServiceSerializer(BaseStemSerializer):
         many=True, source="tags", queryset=Tag.objects.all(), write_only=True
     )
     images = ImageSerializer(many=True, write_only=True, required=False)
+    _STEM_FIELD = "service"
 
     class Meta:
         model = Service
@@ -305,7 +429,7 @@ class ServiceSerializer(BaseStemSerializer):
 # ──────────────────────────────────────────
 # 6.  LISTING  CRUD  &  ANALYTICS
 # ──────────────────────────────────────────
-class ListingSerializer(serializers.ModelSerializer):
+class ListingSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     product = ProductMiniSerializer(read_only=True)
     service = ServiceMiniSerializer(read_only=True)
     town = TownMiniSerializer(read_only=True)
@@ -349,7 +473,7 @@ class ListingSerializer(serializers.ModelSerializer):
         return attrs
 
 
-class PricePointSerializer(serializers.ModelSerializer):
+class PricePointSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     date_info = serializers.SerializerMethodField()
 
     class Meta:
@@ -360,10 +484,72 @@ class PricePointSerializer(serializers.ModelSerializer):
         return date_breakdown(obj.recorded_at)
 
 
+# indexed by month number; calendar.month_abbr would run strftime on every lookup
+_MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+class _History:
+    """Column-wise (price, year, month) arrays for one listing; unpacks as a 3-tuple."""
+    __slots__ = ("prices", "years", "months")
+
+    def __init__(self, rows):
+        # one C-level conversion of the row tuples, then split into columns
+        table = np.array(rows, dtype=np.float64).reshape(-1, 3)
+        self.prices = table[:, 0]
+        self.years = table[:, 1].astype(np.int64)
+        self.months = table[:, 2].astype(np.int64)
+
+    def __iter__(self):
+        return iter((self.prices, self.years, self.months))
+
+
+def _quarter_keys(years, months):
+    return years * 4 + (months - 1) // 3
+
+
+def _quarter_label(key):
+    return f"{key // 4}Q{key % 4 + 1}"  # “2025Q1”
+
+
+def _group_stats(keys, prices):
+    """Sorted unique keys with the mean and sample std (NaN for singletons) of each group."""
+    uniq, inv = np.unique(keys, return_inverse=True)
+    n = np.bincount(inv)
+    mean = np.bincount(inv, weights=prices) / n
+    dev = prices - mean[inv]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        std = np.sqrt(np.bincount(inv, weights=dev * dev) / (n - 1))
+    return uniq, mean, std
+
+
+# below this many points a plain-Python group-by beats numpy's per-call overhead
+_SMALL_HISTORY = 90
+
+
+def _group_means(keys, prices):
+    """Sorted (key, mean) pairs – numpy for long histories, groupby/fmean for short ones."""
+    if prices.size > _SMALL_HISTORY:
+        uniq, mean, _ = _group_stats(keys, prices)
+        return list(zip(uniq.tolist(), mean.tolist()))
+    pairs = sorted(zip(keys.tolist(), prices.tolist()), key=itemgetter(0))
+    return [
+        (key, fmean(p for _, p in grp))
+        for key, grp in groupby(pairs, key=itemgetter(0))
+    ]
+
+
+def _top_n(values, n, largest=True):
+    """Indices of the n largest/smallest non-NaN values, ties in original order."""
+    idx = np.flatnonzero(~np.isnan(values))
+    order = np.argsort(-values[idx] if largest else values[idx], kind="stable")
+    return idx[order[:n]]
+
+
 class ListingAnalyticsSerializer(ListingSerializer):
     """
     Heavy detail view – attaches price history and statistical curves.
-    Helper methods (`_history_df`, etc.) are unchanged from earlier patch.
+    Curves are computed with numpy group-bys over the listing's history.
     """
     price_history = serializers.SerializerMethodField()
     quarterly_curve = serializers.SerializerMethodField()
@@ -384,99 +570,126 @@ class ListingAnalyticsSerializer(ListingSerializer):
         )
 
     # ----------------- helpers -----------------
-    def _history_df(self, obj):
-        df = pd.DataFrame(
-            obj.history.order_by("recorded_at").values("price", "recorded_at")
-        )
-        if df.empty:
-            return df
-        ts = pd.to_datetime(df["recorded_at"])
-        df["year"] = ts.dt.year
-        df["month"] = ts.dt.month_name().str[:3]  # “Jan”, “Feb”, …
-        df["quarter"] = ts.dt.to_period("Q").astype(str)  # “2025Q1”
-        return df
+    @staticmethod
+    def _has_history(obj):
+        # `has_history` is the EXISTS annotation ListingViewSet adds; assume yes without it
+        return getattr(obj, "has_history", True)
+
+    def _history(self, obj):
+        """(prices, years, months) arrays, oldest first – built once per listing."""
+        cache = self.context.setdefault("_hist", {})
+        if obj.pk in cache:
+            return cache[obj.pk]
+
+        if not self._has_history(obj):
+            rows = ()
+        elif _is_prefetched(obj, "history"):
+            rows = [
+                (float(h.price), h.recorded_at.year, h.recorded_at.month)
+                for h in sorted(obj.history.all(), key=lambda h: h.recorded_at)
+            ]
+        else:
+            # price cast and date parts computed in SQL – no Decimal/datetime per row
+            rows = list(
+                obj.history.order_by("recorded_at")
+                .annotate(
+                    price_f=Cast("price", FloatField()),
+                    year=ExtractYear("recorded_at"),
+                    month=ExtractMonth("recorded_at"),
+                )
+                .values_list("price_f", "year", "month")
+            )
+        cache[obj.pk] = _History(rows)
+        return cache[obj.pk]
 
     # ---------- history raw ----------
     def get_price_history(self, obj):
-        return PricePointSerializer(obj.history.order_by("-recorded_at")[:90], many=True).data
+        if not self._has_history(obj):
+            return []
+        if _is_prefetched(obj, "history"):
+            # history_prefetch() already loaded every row – take the newest in Python
+            points = sorted(obj.history.all(), key=lambda h: h.recorded_at, reverse=True)[:90]
+        else:
+            points = obj.history.order_by("-recorded_at")[:90]
+        return PricePointSerializer(points, many=True).data
 
     # ---------- aggregated curves ----
     def get_quarterly_curve(self, obj):
-        df = self._history_df(obj)
-        if df.empty: return []
-        tbl = (df.groupby("quarter")["price"]
-               .mean()
-               .reset_index()
-               .sort_values("quarter"))
-        return [{"label": r.quarter, "avg_price": float(round(r.price, 2))}
-                for r in tbl.itertuples()]
+        prices, years, months = self._history(obj)
+        if not prices.size: return []
+        return [{"label": _quarter_label(k), "avg_price": round(m, 2)}
+                for k, m in _group_means(_quarter_keys(years, months), prices)]
 
     def get_monthly_curve(self, obj):
-        df = self._history_df(obj)
-        if df.empty: return []
-        tbl = (df.groupby("month")["price"]
-               .mean()
-               .reindex([
-            "Jan", "Feb", "Mar", "Apr", "May", "Jun",
-            "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
-        ]).dropna())
-        return [{"label": m, "avg_price": float(round(v, 2))} for m, v in tbl.items()]
+        prices, _, months = self._history(obj)
+        if not prices.size: return []
+        return [{"label": _MONTH_ABBR[k], "avg_price": round(m, 2)}
+                for k, m in _group_means(months, prices)]
 
     # ---------- best / recent quarters --------------
     def get_top_quarter_overall(self, obj):
-        df = self._history_df(obj)
-        if df.empty: return None
-        best = (df.groupby("quarter")["price"].mean()
-                .idxmin())  # lowest average price
-        return best
+        prices, years, months = self._history(obj)
+        if not prices.size: return None
+        keys, mean, _ = _group_stats(_quarter_keys(years, months), prices)
+        return _quarter_label(keys[np.argmin(mean)])  # lowest average price
 
     def get_top_quarter_recent(self, obj):
-        df = self._history_df(obj)
-        if df.empty: return None
-        recent = df[df["year"] == df["year"].max()]
-        if recent.empty: return None
-        best = (recent.groupby("quarter")["price"].mean().idxmin())
-        return best
+        prices, years, months = self._history(obj)
+        if not prices.size: return None
+        recent = years == years.max()
+        keys, mean, _ = _group_stats(_quarter_keys(years[recent], months[recent]), prices[recent])
+        return _quarter_label(keys[np.argmin(mean)])
 
     # ---------- jumps / drops / volatility ----------
-    def _month_step_df(self, obj):
-        df = self._history_df(obj)
-        if df.empty: return pd.DataFrame()
-        m = (df.groupby(["year", "month"])["price"].mean()
-             .reset_index()
-             .sort_values(["year", "month"]))
-        m["prev"] = m["price"].shift(1)
-        m["delta_pct"] = ((m["price"] - m["prev"]) / m["prev"]) * 100
-        return m.dropna()
+    def _month_steps(self, obj):
+        """(month numbers, % change vs previous month) in calendar order."""
+        cache = self.context.setdefault("_month_steps", {})
+        if obj.pk in cache:
+            return cache[obj.pk]
+        prices, years, months = self._history(obj)
+        if prices.size:
+            keys, mean, _ = _group_stats(years * 12 + months - 1, prices)
+        else:
+            keys = mean = np.empty(0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta = (mean[1:] - mean[:-1]) / mean[:-1] * 100
+        cache[obj.pk] = (keys[1:] % 12 + 1).astype(np.int64), delta
+        return cache[obj.pk]
 
     def get_high_jump_months(self, obj, top_n=5):
-        df = self._month_step_df(obj)
-        if df.empty: return []
-        best = df.nlargest(top_n, "delta_pct")
-        return [{"label": r.month, "delta_pct": float(round(r.delta_pct, 1))} for r in best.itertuples()]
+        labels, delta = self._month_steps(obj)
+        return [{"label": _MONTH_ABBR[labels[i]], "delta_pct": float(round(delta[i], 1))}
+                for i in _top_n(delta, top_n)]
 
     def get_high_drop_months(self, obj, top_n=5):
-        df = self._month_step_df(obj)
-        if df.empty: return []
-        worst = df.nsmallest(top_n, "delta_pct")
-        return [{"label": r.month, "delta_pct": float(round(r.delta_pct, 1))} for r in worst.itertuples()]
+        labels, delta = self._month_steps(obj)
+        return [{"label": _MONTH_ABBR[labels[i]], "delta_pct": float(round(delta[i], 1))}
+                for i in _top_n(delta, top_n, largest=False)]
 
     def get_volatile_months(self, obj, top_n=5):
-        df = self._history_df(obj)
-        if df.empty: return []
-        vol = (df.groupby("month")["price"]
-               .std()
-               .nlargest(top_n))
-        return [{"label": m, "std": float(round(v, 2))} for m, v in vol.items()]
+        prices, _, months = self._history(obj)
+        if not prices.size: return []
+        keys, _, std = _group_stats(months, prices)
+        return [{"label": _MONTH_ABBR[keys[i]], "std": float(round(std[i], 2))}
+                for i in _top_n(std, top_n)]
 
     def get_stable_quarters(self, obj, top_n=3):
-        df = self._history_df(obj)
-        if df.empty: return []
-        cv = (df.groupby("quarter")["price"]
-              .agg(["mean", "std"])
-              .assign(cv=lambda d: d["std"] / d["mean"])
-              .nsmallest(top_n, "cv"))
-        return [{"label": idx, "cv": float(round(row.cv, 3))} for idx, row in cv.iterrows()]
+        prices, years, months = self._history(obj)
+        if not prices.size: return []
+        keys, mean, std = _group_stats(_quarter_keys(years, months), prices)
+        cv = std / mean
+        return [{"label": _quarter_label(keys[i]), "cv": float(round(cv[i], 3))}
+                for i in _top_n(cv, top_n, largest=False)]
+
+
+def history_prefetch(lookup="history"):
+    """Full history of each listing, pruned to the columns the analytics read."""
+    return Prefetch(lookup, queryset=_history_qs())
+
+
+def recent_history_prefetch(lookup="history"):
+    """Newest 90 history rows per listing onto `recent_history`, read by ListingWithHistorySerializer."""
+    return Prefetch(lookup, queryset=_recent_history_qs(), to_attr="recent_history")
 
 
 class ListingWithHistorySerializer(ListingSerializer):
@@ -492,16 +705,14 @@ class ListingWithHistorySerializer(ListingSerializer):
 
     # ---- helpers --------------------------------------------------
     def get_price_history(self, obj):
-        qs = (
-            obj.history
-            .order_by("-recorded_at")
-            .values("price", "currency", "recorded_at")[:90]
-        )
+        points = getattr(obj, "recent_history", None)
+        if points is None:
+            points = obj.history.order_by("-recorded_at").only("price", "currency", "recorded_at")
         return [
             {
-                "price": row["price"],
-                "currency": row["currency"],
-                **date_breakdown(row["recorded_at"]),
+                "price": p.price,
+                "currency": p.currency,
+                **date_breakdown(p.recorded_at),
             }
-            for row in qs
+            for p in points[:RECENT_HISTORY_POINTS]
         ]
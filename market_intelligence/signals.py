@@ -1,14 +1,46 @@
 # market_intel/signals.py
-from django.db.models.signals import post_save
+from django.db.models import F, Value
+from django.db.models.functions import Concat
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from .models import PriceListing, PriceHistory
+from .models import Region, District, Town, Market, Category, Product, Service, PriceListing
+from .utils import invalidate_search_cache
 
 
-@receiver(post_save, sender=PriceListing
-          )
-def snapshot_price(sender, instance, **_):
-    PriceHistory.objects.create(
-        listing=instance,
-        price=instance.price,
-        currency=instance.currency or "GHS",
-    )
+# ---- denormalised "name, parent" labels -----------------------------
+def _relabel_children(qs, parent_name):
+    qs.update(display_name=Concat(F("name"), Value(f", {parent_name or ''}")))
+
+
+@receiver(post_save, sender=Region)
+def relabel_districts(sender, instance, created, **_):
+    if created:
+        return
+    _relabel_children(District.objects.filter(region=instance), instance.name)
+
+
+@receiver(post_save, sender=District)
+def relabel_towns(sender, instance, created, **_):
+    if created:
+        return
+    _relabel_children(Town.objects.filter(district=instance), instance.name)
+
+
+@receiver(post_save, sender=Town)
+def relabel_markets(sender, instance, created, **_):
+    if created:
+        return
+    _relabel_children(Market.objects.filter(town=instance), instance.name)
+
+
+# ---- cached explorer / search payloads ------------------------------
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+@receiver(post_save, sender=PriceListing)
+@receiver(post_delete, sender=PriceListing)
+def drop_search_cache(sender, instance, **_):
+    invalidate_search_cache()
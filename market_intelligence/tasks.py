@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+from celery import shared_task
+from django.core.cache import cache
+from django.db.models import Avg, Count, DecimalField, Exists, F, IntegerField, Max, Min, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import PriceListing, PriceHistory
+
+
+def _history_stat(aggregate, output_field):
+    return Subquery(
+        PriceHistory.objects.filter(listing=OuterRef("pk"))
+        .order_by()
+        .values("listing")
+        .annotate(v=aggregate)
+        .values("v"),
+        output_field=output_field,
+    )
+
+
+@shared_task
+def record_price_change(listing_id, price, currency, recorded_at):
+    """Write the history snapshot for a listing price change."""
+    if not PriceListing.objects.filter(pk=listing_id).exists():
+        return
+    PriceHistory.objects.create(
+        listing_id=listing_id,
+        price=price,
+        currency=currency,
+        recorded_at=parse_datetime(recorded_at),
+    )
+
+
+RECONCILE_BATCH_SIZE = 1000
+# snapshots land after the fact (worker backlog), so each run re-reads a margin
+RECONCILE_OVERLAP = timedelta(hours=1)
+_RECONCILE_MARK_KEY = "mi:reconcile_listing_stats:last_run"
+
+
+@shared_task
+def reconcile_listing_stats():
+    """
+    Rebuild the running listing stats from history, for listings changed (or
+    given history) since the previous run – every listing on the first run or
+    after the marker is evicted – one id batch per UPDATE.
+    """
+    started = timezone.now()
+    listings = PriceListing.objects.all()
+    if (last_run := cache.get(_RECONCILE_MARK_KEY)) is not None:
+        since = last_run - RECONCILE_OVERLAP
+        listings = listings.filter(
+            Q(updated_at__gte=since)
+            | Exists(PriceHistory.objects.filter(listing=OuterRef("pk"), recorded_at__gte=since))
+        )
+    ids = list(listings.order_by("pk").values_list("pk", flat=True))
+
+    money = DecimalField(max_digits=10, decimal_places=2)
+    updated = 0
+    for start in range(0, len(ids), RECONCILE_BATCH_SIZE):
+        updated += PriceListing.objects.filter(pk__in=ids[start:start + RECONCILE_BATCH_SIZE]).update(
+            average_price=Coalesce(_history_stat(Avg("price"), money), F("price")),
+            lowest_price=Coalesce(_history_stat(Min("price"), money), F("price")),
+            highest_price=Coalesce(_history_stat(Max("price"), money), F("price")),
+            price_samples=Coalesce(_history_stat(Count("id"), IntegerField()), 1),
+        )
+    cache.set(_RECONCILE_MARK_KEY, started, None)
+    return updated
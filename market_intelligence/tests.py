@@ -1,3 +1,101 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+import numpy as np
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from .models import Category, District, Market, PriceHistory, PriceListing, Product, Region, Town
+from .serializers import _SMALL_HISTORY, _group_means, _group_stats
+
+
+def _rows(response):
+    data = response.json()
+    return data["results"] if isinstance(data, dict) and "results" in data else data
+
+
+class StemListingsEndpointTests(APITestCase):
+    """Stem endpoints with active listings attached (nested, sliced history prefetch)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        region = Region.objects.create(name="Greater Accra")
+        district = District.objects.create(name="Accra Metro", region=region)
+        town = Town.objects.create(name="Osu", district=district)
+        market = Market.objects.create(name="Makola", town=town)
+        category = Category.objects.create(name="Grains")
+        cls.product = Product.objects.create(
+            name="Rice", description="Long grain", sku="RICE-1", category=category,
+        )
+        cls.listing = PriceListing.objects.create(
+            product=cls.product, market=market, price=Decimal("12.00"),
+        )
+        PriceHistory.objects.create(listing=cls.listing, price=Decimal("12.00"), currency="GHS")
+
+    def test_product_list_includes_listings_and_curves(self):
+        response = self.client.get(reverse("market_intelligence:product-list"))
+        self.assertEqual(response.status_code, 200)
+        (row,) = _rows(response)
+        self.assertEqual([l["id"] for l in row["listings"]], [self.listing.pk])
+        self.assertEqual(len(row["location_curves"][str(self.listing.pk)]), 1)
+
+    def test_explorer_and_search_with_listings(self):
+        for url in (
+            reverse("market_intelligence:explorer"),
+            reverse("market_intelligence:global-search") + "?light=0",
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 200)
+
+
+class PriceListingSaveTests(APITestCase):
+    """A plain save() must fold a price edit and queue its history snapshot."""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name="Oils")
+        product = Product.objects.create(name="Palm oil", description="", sku="OIL-1", category=category)
+        cls.town = Town.objects.create(name="Kumasi")
+        cls.listing = PriceListing.objects.create(product=product, town=cls.town, price=Decimal("12.00"))
+
+    def test_plain_save_detects_price_change(self):
+        listing = PriceListing.objects.get(pk=self.listing.pk)
+        listing.price = Decimal("20.00")
+        with self.captureOnCommitCallbacks() as callbacks:
+            listing.save()
+        listing.refresh_from_db()
+        self.assertEqual(listing.highest_price, Decimal("20.00"))
+        self.assertEqual(listing.price_samples, 2)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_save_without_price_change_records_nothing(self):
+        listing = PriceListing.objects.get(pk=self.listing.pk)
+        listing.note = "checked"
+        with self.captureOnCommitCallbacks() as callbacks:
+            listing.save()
+        self.assertEqual(callbacks, [])
+
+
+class GroupMeansTests(SimpleTestCase):
+    """_group_means: the short-history groupby/fmean path must match the numpy one."""
+
+    def _numpy_means(self, keys, prices):
+        uniq, mean, _ = _group_stats(keys, prices)
+        return list(zip(uniq.tolist(), mean.tolist()))
+
+    def test_short_history_matches_numpy(self):
+        keys = np.array([3, 1, 3, 2, 1, 3])
+        prices = np.array([9.0, 1.0, 6.0, 4.0, 3.0, 3.0])
+        self.assertLessEqual(prices.size, _SMALL_HISTORY)
+        self.assertEqual(_group_means(keys, prices), [(1, 2.0), (2, 4.0), (3, 6.0)])
+        for (k, m), (nk, nm) in zip(_group_means(keys, prices), self._numpy_means(keys, prices)):
+            self.assertEqual(k, nk)
+            self.assertAlmostEqual(m, nm)
+
+    def test_long_history_uses_numpy(self):
+        keys = np.arange(_SMALL_HISTORY + 10) % 4
+        prices = np.arange(_SMALL_HISTORY + 10, dtype=float)
+        self.assertEqual(_group_means(keys, prices), self._numpy_means(keys, prices))
+
+    def test_empty_history(self):
+        self.assertEqual(_group_means(np.array([], dtype=int), np.array([])), [])
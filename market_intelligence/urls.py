@@ -10,22 +10,30 @@ from .views import (
 
 app_name = 'market_intelligence'
 
+_ROUTES = (
+    ("categories", CategoryViewSet, "category"),
+    ("tags", TagViewSet, "tag"),
+    ("products", ProductViewSet, "product"),
+    ("services", ServiceViewSet, "services"),
+    ("listings", ListingViewSet, "listing"),
+    ("regions", RegionViewSet, "region"),
+    ("districts", DistrictViewSet, "district"),
+    ("towns", TownViewSet, "town"),
+    ("markets", MarketViewSet, "market"),
+    (r"search/regions", RegionSearchView, "search-regions"),
+    (r"search/districts", DistrictSearchView, "search-districts"),
+    (r"search/towns", TownSearchView, "search-towns"),
+)
+
 router = DefaultRouter()
-router.register("categories", CategoryViewSet, basename="category")
-router.register("tags",       TagViewSet,       basename="tag")
-router.register("products",   ProductViewSet,   basename="product")
-router.register("services",  ServiceViewSet,  basename="services")
-router.register("listings",   ListingViewSet,   basename="listing")
-router.register("regions",   RegionViewSet,   basename="region")
-router.register("districts", DistrictViewSet, basename="district")
-router.register("towns",     TownViewSet,     basename="town")
-router.register("markets",   MarketViewSet,   basename="market")
-router.register(r"search/regions", RegionSearchView, basename="search-regions")
-router.register(r"search/districts", DistrictSearchView, basename="search-districts")
-router.register(r"search/towns", TownSearchView, basename="search-towns")
+for prefix, viewset, basename in _ROUTES:
+    router.register(prefix, viewset, basename=basename)
+
+# build the router patterns once at import
+_ROUTER_URLS = router.urls
 
 urlpatterns = [
-    path("", include(router.urls)),
+    path("", include(_ROUTER_URLS)),
 ]
 
 urlpatterns += [
@@ -0,0 +1,29 @@
+# market_intelligence/utils.py
+from hashlib import sha1
+
+from django.core.cache import cache
+
+SEARCH_CACHE_TTL = 60  # also bounds staleness from queryset.update() writes that skip signals
+_SEARCH_GENERATION_KEY = "mi:search:gen"
+
+
+def _search_generation():
+    return cache.get_or_set(_SEARCH_GENERATION_KEY, 0, None)
+
+
+def search_cache_key(prefix, params):
+    """
+    Cache key for an explorer / search payload: the query string, normalised
+    (sorted, multi-values kept), plus the current generation so one bump
+    retires every cached variant without a key scan.
+    """
+    digest = sha1(repr(sorted(params.lists())).encode()).hexdigest()
+    return f"mi:{prefix}:{_search_generation()}:{digest}"
+
+
+def invalidate_search_cache():
+    """Retire every cached explorer / search payload after a catalogue write."""
+    try:
+        cache.incr(_SEARCH_GENERATION_KEY)
+    except ValueError:  # evicted / never set
+        cache.set(_SEARCH_GENERATION_KEY, 1, None)
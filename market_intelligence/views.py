@@ -1,6 +1,11 @@
+from collections import defaultdict
 from typing import Iterable, Tuple
 
-from django.db.models import Min, Max, Avg, Prefetch, Q
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Exists, Min, Max, Avg, OuterRef, Q
+from django.db.models.functions import Greatest
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
 from rest_framework import generics, pagination, viewsets, filters
@@ -10,9 +15,11 @@ from core.lookup_views import AutocompleteMixin
 from core.response import ok
 from market_intelligence.models import PriceListing, PriceHistory, Product, Category, Tag, Market, \
     Town, Region, District, Service
+from market_intelligence.utils import SEARCH_CACHE_TTL, search_cache_key
 from market_intelligence.serializers import ListingWithHistorySerializer, ProductSerializer, CategorySerializer, \
     TagSerializer, ListingSerializer, CategoryDetailSerializer, TownSerializer, MarketSerializer, RegionSerializer, \
-    DistrictSerializer, ListingAnalyticsSerializer, ServiceSerializer
+    DistrictSerializer, ListingAnalyticsSerializer, ServiceSerializer, stem_listings_prefetch, \
+    recent_history_prefetch, history_prefetch, STEM_COLUMNS
 
 
 class DefaultPagination(pagination.PageNumberPagination):
@@ -73,6 +80,9 @@ class CategoryViewSet(viewsets.ModelViewSet):
     filter_backends = (filters.SearchFilter,)
     search_fields = ("name",)
 
+    def get_queryset(self):
+        return CategorySerializer.prefetch_queryset(super().get_queryset())
+
     # choose richer serializer for /<id>/ -----------------------------
     def get_serializer_class(self):
         if self.action == "retrieve":
@@ -90,17 +100,12 @@ class TagViewSet(viewsets.ModelViewSet):
     search_fields = ("name",)
 
 
-_LISTING_PREFETCH = (
-    "listings__town",
-    "listings__market",
-    "listings__history",
-)
-
+# PriceListing paths, matched inside an EXISTS so a stem never fans out per listing
 _LOCATION_Q = dict(
-    region="listings__town__district__region_id",
-    district="listings__town__district_id",
-    town="listings__town_id",
-    market="listings__market_id",
+    region="town__district__region_id",
+    district="town__district_id",
+    town="town_id",
+    market="market_id",
 )
 
 
@@ -112,12 +117,7 @@ class _BaseStemViewSet(viewsets.ModelViewSet):
     search_fields = ("name", "description", "sku")
 
     def _apply_location_filters(self, qs):
-        params = self.request.query_params
-        flt = Q()
-        for key, path in _LOCATION_Q.items():
-            if val := params.get(key):
-                flt &= Q(**{path: val})
-        return qs.filter(flt) if flt else qs
+        return _apply_location(qs, self.request.query_params)
 
 
 # ───────────────── Product / Service ───────────────────
@@ -143,44 +143,15 @@ class ProductViewSet(_BaseStemViewSet):
         qs = (
             Product.objects
             .select_related("category")
+            .only(*STEM_COLUMNS)
             .prefetch_related(  # new relations
                 "tags",
                 "images",
-                "listings__town",
-                "listings__market",
-                "listings__history",
+                stem_listings_prefetch(),
             )
             .order_by("-id")
-            .order_by("-id")
         )
-
-        # --- location drill-down -------------------------------
-        params = self.request.query_params
-        region = params.get("region")
-        district = params.get("district")
-        town = params.get("town")
-        market = params.get("market")
-
-        if any([region, district, town, market]):
-            # Build a single Q() to match listings down the chain
-            listing_filter = Q()
-
-            if market:
-                listing_filter &= Q(productandservicelisting__market_id=market)
-            if town:
-                listing_filter &= Q(productandservicelisting__town_id=town)
-            if district:
-                listing_filter &= Q(
-                    productandservicelisting__town__district_id=district
-                )
-            if region:
-                listing_filter &= Q(
-                    productandservicelisting__town__district__region_id=region
-                )
-
-            qs = qs.filter(listing_filter)
-
-        return qs
+        return self._apply_location_filters(qs)
 
 
 @extend_schema(tags=["Market Intelligence Services"])
@@ -198,35 +169,15 @@ class ServiceViewSet(_BaseStemViewSet):
         qs = (
             Service.objects
             .select_related("category")
+            .only(*STEM_COLUMNS)
             .prefetch_related(
                 "tags",
                 "images",
-                "listings__town",
-                "listings__market",
-                "listings__history",
+                stem_listings_prefetch(),
             )
             .order_by("-id")
         )
-
-        params = self.request.query_params
-        region = params.get("region")
-        district = params.get("district")
-        town = params.get("town")
-        market = params.get("market")
-
-        if any([region, district, town, market]):
-            q = Q()
-            if market:
-                q &= Q(productandservicelisting__market_id=market)
-            if town:
-                q &= Q(productandservicelisting__town_id=town)
-            if district:
-                q &= Q(productandservicelisting__town__district_id=district)
-            if region:
-                q &= Q(productandservicelisting__town__district__region_id=region)
-            qs = qs.filter(q)
-
-        return qs
+        return self._apply_location_filters(qs)
 
 
 # ───────────────── Listing ──────────────────────────────
@@ -238,15 +189,26 @@ class ListingViewSet(viewsets.ModelViewSet):
     list            → ListingSerializer (light)
     """
     queryset = PriceListing.objects.select_related(
-        "product", "service",
+        "product__category", "service__category",
         "town", "market", "market__town"
-    ).prefetch_related("history")
+    ).defer(
+        "product__description", "service__description",
+    )
     permission_classes = (Everyone,)
     filter_backends = (DjangoFilterBackend,)
     filterset_fields = (
         "town", "market", "product", "service", "status"
     )
 
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action != "retrieve":
+            return qs
+        # the analytics short-circuit on has_history instead of probing an empty history
+        return qs.annotate(
+            has_history=Exists(PriceHistory.objects.filter(listing=OuterRef("pk")))
+        ).prefetch_related(history_prefetch())
+
     def get_serializer_class(self):
         if self.action == "retrieve":
             return ListingAnalyticsSerializer
@@ -270,36 +232,61 @@ class ExplorerView(generics.ListAPIView):
     permission_classes = (Everyone,)
 
     def _base_qs(self, model):
-        qs = model.objects.select_related("category")
+        qs = model.objects.select_related("category").only(*STEM_COLUMNS).prefetch_related(
+            "tags", "images", stem_listings_prefetch(),
+        )
         p = self.request.query_params
         if town := p.get("town"):
-            qs = qs.filter(listings__town_id=town)
+            qs = _has_listing(qs, town_id=town)
         elif district := p.get("district"):
-            qs = qs.filter(listings__town__district_id=district)
+            qs = _has_listing(qs, town__district_id=district)
         elif region := p.get("region"):
-            qs = qs.filter(listings__town__district__region_id=region)
+            qs = _has_listing(qs, town__district__region_id=region)
         if cat := p.get("category"):
             qs = qs.filter(category_id=cat)
-        return qs.distinct()
+        return qs
 
     def get_queryset(self):  # never used – needed for DRF
         return Product.objects.none()
 
     def list(self, request, *args, **kwargs):
-        prods = self._base_qs(Product)
-        servs = self._base_qs(Service)
-        cat_ids = set(prods.values_list("category_id", flat=True)) | set(servs.values_list("category_id", flat=True))
+        # public payload; dropped by market_intelligence.signals on catalogue writes
+        key = search_cache_key("explorer", request.query_params)
+        out = cache.get(key)
+        if out is None:
+            out = self._build()
+            cache.set(key, out, SEARCH_CACHE_TTL)
+        return ok("OK", out)
 
+    def _build(self):
+        # one fetch per stem type, grouped in memory – no per-category re-filter
+        prods, servs = defaultdict(list), defaultdict(list)
+        for p in self._base_qs(Product):
+            prods[p.category_id].append(p)
+        for s in self._base_qs(Service):
+            servs[s.category_id].append(s)
+
+        cats = CategorySerializer.prefetch_queryset(
+            Category.objects.filter(id__in=prods.keys() | servs.keys()).order_by("name")
+        )
         out = []
-        for cat in Category.objects.filter(id__in=cat_ids).order_by("name"):
+        for cat in cats:
             out.append({
                 "category": CategorySerializer(cat).data,
-                "products": ProductSerializer(prods.filter(category=cat),
-                                              many=True).data,
-                "services": ServiceSerializer(servs.filter(category=cat),
-                                              many=True).data,
+                "products": ProductSerializer(prods[cat.id], many=True).data,
+                "services": ServiceSerializer(servs[cat.id], many=True).data,
             })
-        return ok("OK", out)
+        return out
+
+
+# what ListingWithHistorySerializer reads off a listing and its joined rows
+_LISTING_ROW_COLUMNS = (
+    "id", "kind", "price", "currency", "note", "status",
+    "product__id", "product__name", "product__category__name",
+    "service__id", "service__name", "service__category__name",
+    "town__id", "town__name",
+    "market__id", "market__name", "market__town__id", "market__town__name",
+)
 
 
 # ──────────────────────────────────────────────────────────
@@ -319,8 +306,9 @@ class MarketProductView(generics.ListAPIView):
         listing_qs = (
             PriceListing.objects
             .filter(market_id=market_id, status=True)
-            .select_related("product", "service",  # grab whichever exists
-                            "market")
+            .select_related("product__category", "service__category",  # grab whichever exists
+                            "town", "market__town")
+            .only(*_LISTING_ROW_COLUMNS)
         )
 
         if cat_id:
@@ -328,11 +316,8 @@ class MarketProductView(generics.ListAPIView):
                 Q(product__category_id=cat_id) | Q(service__category_id=cat_id)
             )
 
-        # prefetch latest 90 price pts per listing
-        price_qs = PriceHistory.objects.order_by("-recorded_at")
-        return listing_qs.prefetch_related(
-            Prefetch("history", queryset=price_qs)
-        )[:90]
+        # latest 90 price pts per listing; the page size bounds the listings
+        return listing_qs.prefetch_related(recent_history_prefetch())
 
 
 # ──────────────────────────────────────────────────────────
@@ -348,37 +333,41 @@ class ProductComparisonView(generics.GenericAPIView):
         market_ids = request.GET.get("markets", "")
         ids = [int(i) for i in market_ids.split(",") if i.isdigit()][:3]
 
-        listings = (
+        listings = list(
             PriceListing.objects
             .filter(
                 Q(product_id=pk) | Q(service_id=pk),  # ← stem-agnostic match
                 market_id__in=ids,
                 status=True
             )
-            .select_related("market", "market__town",
-                            "product", "service")
-            .prefetch_related(
-                Prefetch("history",
-                         queryset=PriceHistory.objects.order_by("-recorded_at"))
-            )
+            .select_related("town", "market", "market__town",
+                            "product__category", "service__category")
+            .only(*_LISTING_ROW_COLUMNS)
+            .prefetch_related(recent_history_prefetch())
         )
 
         ser = self.get_serializer(listings, many=True)
 
-        # stats
+        # stats – aggregated on the history table itself, (listing, recorded_at) index
         summary = (
-            listings[:90].values("market__name")
+            PriceHistory.objects
+            .filter(listing_id__in=[l.id for l in listings])
+            .values("listing__market__name")
             .annotate(
-                latest=Min("history__recorded_at"),
-                min=Min("history__price"),
-                max=Max("history__price"),
-                avg=Avg("history__price"),
+                latest=Max("recorded_at"),
+                min=Min("price"),
+                max=Max("price"),
+                avg=Avg("price"),
             )
+            .order_by("listing__market__name")
         )
 
         return ok("Comparison", {
             "listings": ser.data,
-            "stats": list(summary),
+            "stats": [
+                {"market__name": row.pop("listing__market__name"), **row}
+                for row in summary
+            ],
         })
 
 
@@ -393,45 +382,58 @@ class ServiceComparisonView(ProductComparisonView):
         return super().get(request, pk)
 
 
-_LOCATION_SEARCH_Q = {
-    "region": "listings__town__district__region_id",
-    "district": "listings__town__district_id",
-    "town": "listings__town_id",
-    "market": "listings__market_id",
-}
+def _has_listing(qs, **kw) -> Iterable:
+    """Stems with at least one listing matching `kw` – EXISTS, one row per stem, no DISTINCT."""
+    listings = PriceListing.objects.filter(**{qs.model._meta.model_name: OuterRef("pk")}, **kw)
+    return qs.filter(Exists(listings))
 
 
 def _apply_location(qs, params) -> Iterable:
     """Apply ?region / ?district / ?town / ?market cascade."""
-    flt = Q()
-    for key, path in _LOCATION_SEARCH_Q.items():
-        if val := params.get(key):
-            flt &= Q(**{path: val})
-    return qs.filter(flt) if flt else qs
+    # all conditions go into one subquery, so they must hold for the same listing
+    kw = {path: val for key, path in _LOCATION_Q.items() if (val := params.get(key))}
+    return _has_listing(qs, **kw) if kw else qs
+
+
+def _apply_text_search(qs, text_fields: Tuple[str, ...], q: str) -> Iterable:
+    """
+    Fuzzy match on `text_fields`, best match first.
+    `<%` (word similarity) is served by the trigram GIN indexes; the sqlite
+    dev database falls back to icontains.
+    """
+    if connection.vendor != "postgresql":
+        txt = Q()
+        for f in text_fields:
+            txt |= Q(**{f"{f}__icontains": q})
+        return qs.filter(txt)
+
+    txt = Q()
+    for f in text_fields:
+        txt |= Q(**{f"{f}__trigram_word_similar": q})
+    return qs.filter(txt).annotate(
+        sim=Greatest(*(TrigramWordSimilarity(q, f) for f in text_fields)),
+    ).order_by("-sim")
 
 
 def _apply_many_id_filter(qs, params, param_key: str, field: str) -> Iterable:
     """
-    ?tags=1,4,10  →  qs.filter(tags__id__in=[1,4,10])
+    ?tags=1,4,10  →  stems carrying any of tags 1, 4, 10
+    (EXISTS on the M2M through table, so a stem with several matches appears once)
     """
     if raw := params.get(param_key):
         try:
             ids = [int(i) for i in raw.split(",") if i.isdigit()]
             if ids:
-                qs = qs.filter(**{f"{field}__id__in": ids})
+                m2m = qs.model._meta.get_field(field)
+                qs = qs.filter(Exists(m2m.remote_field.through.objects.filter(**{
+                    m2m.m2m_field_name(): OuterRef("pk"),
+                    f"{m2m.m2m_reverse_field_name()}_id__in": ids,
+                })))
         except ValueError:
             pass
     return qs
 
 
-def _prefetch_history(qs):
-    """Reuse in Product *and* Service queries – grabs last 90 points."""
-    price_qs = PriceHistory.objects.order_by("-recorded_at")[:90]
-    return qs.prefetch_related(
-        Prefetch("listings__history", queryset=price_qs)
-    )
-
-
 @extend_schema(tags=["Market Intelligence Search"])
 class GlobalSearchView(generics.GenericAPIView):
     """
@@ -447,6 +449,7 @@ class GlobalSearchView(generics.GenericAPIView):
     | `tags`       | comma-separated tag ids                          |
     | location     | `region`, `district`, `town`, `market` (cascades)|
     | `limit`      | max rows per stem (default = 30)                 |
+    | `light`      | `1` → flat rows (no listings / curves)           |
 
     **JSON response**
 
@@ -465,15 +468,13 @@ class GlobalSearchView(generics.GenericAPIView):
         qs = (
             model.objects
             .select_related("category")
-            .prefetch_related("tags", "images", "listings__town",
-                              "listings__market")
+            .only(*STEM_COLUMNS)
+            # the stem serializers read `active_listings` (newest 90 points each)
+            .prefetch_related("tags", "images", stem_listings_prefetch())
         )
         # full-text -------------------------------------------------
         if q := params.get("q", "").strip():
-            txt = Q()
-            for f in text_fields:
-                txt |= Q(**{f"{f}__icontains": q})
-            qs = qs.filter(txt)
+            qs = _apply_text_search(qs, text_fields, q)
 
         # category / tags ------------------------------------------
         if cat := params.get("category"):
@@ -484,13 +485,51 @@ class GlobalSearchView(generics.GenericAPIView):
         # location cascade -----------------------------------------
         qs = _apply_location(qs, params)
 
-        return _prefetch_history(qs).distinct()
+        return qs
 
     # --------------------------------------------------------------
     def get(self, request, *args, **kwargs):
-        params = request.query_params
+        key = search_cache_key("search", request.query_params)
+        data = cache.get(key)
+        if data is None:
+            data = self._search(request.query_params)
+            cache.set(key, data, SEARCH_CACHE_TTL)
+        return ok("search results", data)
+
+    @staticmethod
+    def _light_rows(model, qs):
+        """
+        Flat dicts for ?light=1 – a values() projection plus one tag query,
+        no serializer instances and no listing / history prefetches.
+        """
+        rows = list(
+            qs.prefetch_related(None)
+            .values("id", "name", "description", "sku", "category_id", "category__name")
+        )
+        stem = model._meta.model_name
+        tags = defaultdict(list)
+        for stem_id, tag_id, tag_name in (
+            model.tags.through.objects
+            .filter(**{f"{stem}_id__in": [r["id"] for r in rows]})
+            .values_list(f"{stem}_id", "tag_id", "tag__name")
+        ):
+            tags[stem_id].append({"id": tag_id, "name": tag_name})
+
+        object_type = model.__name__
+        return [
+            {
+                "id": r["id"], "name": r["name"], "description": r["description"],
+                "sku": r["sku"], "object_type": object_type,
+                "category": {"id": r["category_id"], "name": r["category__name"]},
+                "tags": tags[r["id"]],
+            }
+            for r in rows
+        ]
+
+    def _search(self, params):
         stem_type = params.get("type", "").lower()
         limit = int(params.get("limit", 30))
+        light = params.get("light") in ("1", "true")
 
         data = {"products": [], "services": []}
 
@@ -501,7 +540,7 @@ class GlobalSearchView(generics.GenericAPIView):
                 ("name", "description"),
                 params
             )[:limit]
-            data["products"] = ProductSerializer(
+            data["products"] = self._light_rows(Product, prod_qs) if light else ProductSerializer(
                 prod_qs, many=True, context=self.get_serializer_context()
             ).data
 
@@ -512,11 +551,11 @@ class GlobalSearchView(generics.GenericAPIView):
                 ("name", "description"),  # NB: Service.name is “name” field
                 params
             )[:limit]
-            data["services"] = ServiceSerializer(
+            data["services"] = self._light_rows(Service, srv_qs) if light else ServiceSerializer(
                 srv_qs, many=True, context=self.get_serializer_context()
             ).data
 
-        return ok("search results", data)
+        return data
 
 
 # ------------------------------------------------------------------
@@ -548,7 +587,7 @@ class AutoCompleteView(generics.ListAPIView):
                 return []
             return list(
                 model.objects
-                .filter(**{f"{field}__icontains": q})
+                .filter(**{f"{field}__icontains": q})  # substring – the trigram GIN index serves this on PG
                 .values_list(field, flat=True)
                 .order_by(field)[:limit]
             )
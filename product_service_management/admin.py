@@ -1,6 +1,9 @@
 from django.contrib import admin
+from django.db.models import Count, Prefetch
 from django.utils.html import format_html
 
+from market_intelligence.models import District, Region, Town
+
 from .models import (
     SKU, Category,
     ProductCondition, ProductServiceStatus,
@@ -71,11 +74,11 @@ class CategoryAdmin(admin.ModelAdmin):
     ordering = ("parent__name", "name")
 
     def get_queryset(self, request):
-        return super().get_queryset(request).prefetch_related("children")
+        return super().get_queryset(request).annotate(_children_count=Count("children"))
 
-    @admin.display(description="# children")
+    @admin.display(description="# children", ordering="_children_count")
     def children_count(self, obj):
-        return obj.children.count()
+        return obj._children_count
 
     @admin.display(description="Icon")
     def preview_icon(self, obj):
@@ -255,20 +258,25 @@ class VendorServiceAdmin(admin.ModelAdmin):
 
     @admin.display(description="Regions")
     def region_list(self, obj):
-        return ", ".join(obj.regions.values_list("name", flat=True))
+        return ", ".join(o.name for o in obj.regions.all())
 
     @admin.display(description="Districts")
     def district_list(self, obj):
-        return ", ".join(obj.districts.values_list("name", flat=True))
+        return ", ".join(o.name for o in obj.districts.all())
 
     @admin.display(description="Towns")
     def town_list(self, obj):
-        return ", ".join(obj.towns.values_list("name", flat=True))
+        return ", ".join(o.name for o in obj.towns.all())
 
     def get_queryset(self, request):
         return (
             super()
             .get_queryset(request)
             .select_related("service", "provider", "business", "pricing_type")
-            .prefetch_related("regions", "districts", "towns")
+            .prefetch_related(
+                # values_list() would bypass these caches and query per row
+                Prefetch("regions", queryset=Region.objects.only("id", "name")),
+                Prefetch("districts", queryset=District.objects.only("id", "name")),
+                Prefetch("towns", queryset=Town.objects.only("id", "name")),
+            )
         )
@@ -12,6 +12,7 @@ from business.serializers import BusinessBriefSerializer
 from core.response import ok
 from feedback.models import Feedback
 from feedback.serializers import FeedbackPublicSerializer
+from feedback.utils import USER_DISPLAY
 from market_intelligence.serializers import RegionSerializer, DistrictSerializer
 from .models import (
     Category, SKU,
@@ -730,7 +731,15 @@ class VendorProductDetailSerializer(VendorProductSerializer):
 
     def get_feedback(self, obj):
         ct = ContentType.objects.get_for_model(obj)
-        qs = Feedback.objects.filter(content_type=ct, object_id=obj.listing_id).order_by("-submitted_at")
+        qs = (
+            Feedback.objects.filter(content_type=ct, object_id=obj.listing_id)
+            .prefetch_related("tags")
+            .annotate(
+                user_display=USER_DISPLAY,
+                _upvotes_count=Count("upvotes", distinct=True),
+            )
+            .order_by("-submitted_at")
+        )
         result = {}
         for key, _ in Feedback.FEEDBACK_TYPE_CHOICES:
             subset = qs.filter(feedback_type=key)
@@ -1211,7 +1220,15 @@ class VendorServiceDetailSerializer(VendorServiceSerializer):
 
     def get_feedback(self, obj):
         ct = ContentType.objects.get_for_model(obj)
-        qs = Feedback.objects.filter(content_type=ct, object_id=obj.vendor_service_id).order_by("-submitted_at")
+        qs = (
+            Feedback.objects.filter(content_type=ct, object_id=obj.vendor_service_id)
+            .prefetch_related("tags")
+            .annotate(
+                user_display=USER_DISPLAY,
+                _upvotes_count=Count("upvotes", distinct=True),
+            )
+            .order_by("-submitted_at")
+        )
         result = {}
         for key, _ in Feedback.FEEDBACK_TYPE_CHOICES:
             subset = qs.filter(feedback_type=key)